@@ -0,0 +1,94 @@
+"""
+Parallel batch validation over a shared-memory input buffer.
+
+The statements of a batch are written once into a shared memory block:
+
+    [count][count + 1 byte offsets][utf-8 statement text]   (int64 header)
+
+Workers attach to the block by name and decode only their own slice of
+it, so no SQL text is pickled on the way in; each statement of a slice
+goes through cli.pipeline.run_query. Errors come back as
+compact ErrorRecord tuples (catalog code, position, params); their
+message text is only rendered when the report is written.
+"""
+
+import multiprocessing
+import struct
+from multiprocessing import shared_memory
+
+from cli.pipeline import build_engine, get_dialect, run_query
+
+_HEADER = struct.Struct("<q")
+
+_shm = None
+_dialect = None
+_engine = None
+_catalog = None
+
+
+def pack_queries(queries):
+    """Copy the statement texts into a new shared memory block."""
+    encoded = [q["sql"].encode("utf-8") for q in queries]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    base = _HEADER.size * (len(encoded) + 2)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, base + offsets[-1]))
+    struct.pack_into(f"<{len(offsets) + 1}q", shm.buf, 0, len(encoded), *offsets)
+    pos = base
+    for data in encoded:
+        shm.buf[pos:pos + len(data)] = data
+        pos += len(data)
+    return shm
+
+
+def _init_worker(shm_name, dialect_name, rule_config, catalog):
+    global _shm, _dialect, _engine, _catalog
+    # Pool workers share the parent's resource tracker, so attaching here
+    # does not hand ownership of the block to the worker.
+    _shm = shared_memory.SharedMemory(name=shm_name)
+    _dialect = get_dialect(dialect_name)
+    _engine = build_engine(dialect_name, rule_config)
+    _catalog = catalog
+
+
+def read_statements(shm, lo, hi):
+    """Decode statements lo..hi-1 straight out of the shared buffer."""
+    (count,) = _HEADER.unpack_from(shm.buf, 0)
+    base = _HEADER.size * (count + 2)
+    offsets = struct.unpack_from(f"<{hi - lo + 1}q", shm.buf, _HEADER.size * (lo + 1))
+    return [
+        str(shm.buf[base + offsets[k]:base + offsets[k + 1]], "utf-8")
+        for k in range(hi - lo)
+    ]
+
+
+def _validate_chunk(bounds):
+    lo, hi = bounds
+    return [run_query(sql, _dialect, _engine, _catalog) for sql in read_statements(_shm, lo, hi)]
+
+
+def validate_batch(queries, dialect_name, workers, chunksize=64, rule_config=None,
+                   catalog=None):
+    """
+    Validate queries across worker processes.
+
+    Yields one (statement_type, errors, seconds) result per query, in
+    input order.
+    """
+    # Build (and discard) the engine here so that an unknown dialect or rule
+    # name raises ValueError before the pool and the shared memory block
+    # exist, instead of failing inside every worker's initializer
+    build_engine(dialect_name, rule_config)
+    shm = pack_queries(queries)
+    try:
+        bounds = [(lo, min(lo + chunksize, len(queries)))
+                  for lo in range(0, len(queries), chunksize)]
+        with multiprocessing.Pool(workers, initializer=_init_worker,
+                                  initargs=(shm.name, dialect_name, rule_config, catalog)) as pool:
+            for results in pool.imap(_validate_chunk, bounds):
+                yield from results
+    finally:
+        shm.close()
+        shm.unlink()
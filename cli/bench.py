@@ -0,0 +1,85 @@
+"""
+Peak-memory benchmark for pathological single statements.
+
+    python -m cli.bench
+    python -m cli.bench --elements 100000 --dialect mysql > bench_output.txt
+
+Each case generates one huge statement (a long IN list, many VALUES
+tuples) and validates it through cli.pipeline.validate_query with the
+full pipeline, in bounded mode with both caps and with the token cap
+alone. For each mode it reports the wall time
+and the peak memory allocated during the call, traced with tracemalloc
+(the statement text itself is allocated beforehand and not counted).
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from cli.pipeline import DIALECTS, build_engine, get_dialect, validate_query
+
+
+def in_list(n):
+    return "SELECT * FROM t WHERE id IN (" + ", ".join(map(str, range(n))) + ")"
+
+
+def values(n):
+    return "INSERT INTO t (id, name) VALUES " + ", ".join(f"({i}, 'name {i}')" for i in range(n))
+
+
+CASES = {"in_list": in_list, "values": values}
+
+
+def measure(sql, dialect, engine):
+    """
+    Validate sql twice: timed, then under tracemalloc (tracing slows every
+    allocation down, so it would skew the timing). Returns (seconds, peak
+    bytes, error count).
+    """
+    start = time.perf_counter()
+    _, errors = validate_query(sql, dialect, engine)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        validate_query(sql, dialect, engine)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak, len(errors)
+
+
+def run(elements, dialect_name="ansi", max_statement_chars=1_000_000, max_tokens=100_000):
+    dialect = get_dialect(dialect_name)
+    modes = {
+        "full": build_engine(dialect_name),
+        "bounded": build_engine(dialect_name, {"max_statement_chars": max_statement_chars,
+                                               "max_tokens": max_tokens}),
+        # Token cap alone: up to max_tokens tokens are held before streaming
+        "tokens": build_engine(dialect_name, {"max_tokens": max_tokens}),
+    }
+
+    print(f"dialect={dialect_name} elements={elements} "
+          f"max_statement_chars={max_statement_chars} max_tokens={max_tokens}")
+    print(f"{'case':<10}{'mode':<10}{'chars':>12}{'seconds':>10}{'peak MiB':>12}{'errors':>8}")
+    for name, generate in CASES.items():
+        sql = generate(elements)
+        for mode, engine in modes.items():
+            seconds, peak, errors = measure(sql, dialect, engine)
+            print(f"{name:<10}{mode:<10}{len(sql):>12}{seconds:>10.2f}"
+                  f"{peak / 2 ** 20:>12.2f}{errors:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Peak memory of oversized statements, "
+                                                 "full pipeline vs bounded mode")
+    parser.add_argument("--elements", type=int, default=500_000,
+                        help="IN list elements / VALUES tuples per statement (default: 500000)")
+    parser.add_argument("--dialect", "-d", choices=list(DIALECTS.keys()), default="ansi")
+    parser.add_argument("--max-statement-chars", type=int, default=1_000_000,
+                        help="Bounded mode character cap (default: 1000000)")
+    parser.add_argument("--max-tokens", type=int, default=100_000,
+                        help="Bounded mode token cap (default: 100000)")
+    args = parser.parse_args()
+
+    run(args.elements, args.dialect, args.max_statement_chars, args.max_tokens)
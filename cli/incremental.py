@@ -0,0 +1,142 @@
+"""
+Incremental validation against a manifest from the previous run.
+
+The manifest records a SHA-256 of every input file with the hashes of its
+statements, and the result of every statement keyed by statement hash:
+
+    {"version": 1, "fingerprint": "...",
+     "files": {"inputs/a.sql": {"hash": "...", "statements": ["...", ...]}},
+     "results": {"<statement hash>": [statement_type, [[code, line, column,
+                                                        start, end, params]]]}}
+
+Only statements whose hash has no recorded result are validated; whole
+unchanged files, and unchanged statements of edited files, are merged
+from the manifest. Results are reused only when the run fingerprint
+(dialect, rule config, schema and validator source) is the one they were
+recorded under, so changing any of those re-validates everything.
+"""
+
+import hashlib
+import io
+import json
+import os
+
+from io_layer.reader import input_files, split_queries
+from io_layer.manifest import read_manifest, write_manifest
+from parser.errors import ErrorRecord
+from cli.pipeline import build_engine, get_dialect, run_query
+from cli.batch import validate_batch
+
+MANIFEST_VERSION = 1
+
+# Sources whose changes can change a result
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_VALIDATOR_SOURCES = ("parser", "dialect", "schema", os.path.join("cli", "pipeline.py"))
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _source_digest():
+    h = hashlib.sha256()
+    for entry in _VALIDATOR_SOURCES:
+        path = os.path.join(_ROOT, entry)
+        files = [path] if os.path.isfile(path) else sorted(
+            os.path.join(path, name) for name in os.listdir(path) if name.endswith(".py"))
+        for file_path in files:
+            with open(file_path, 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def fingerprint(dialect_name, rule_config=None, catalog=None):
+    """Identify everything besides the SQL text that a result depends on."""
+    schema = None
+    if catalog is not None:
+        schema = sorted((name, sorted(columns)) for name, columns in catalog.tables.items())
+    config = {"dialect": dialect_name, "rules": rule_config or {}, "schema": schema,
+              "source": _source_digest()}
+    return _digest(json.dumps(config, sort_keys=True).encode("utf-8"))
+
+
+def _encode(stmt, errors):
+    return [stmt, [[e.code, e.line, e.column, e.start, e.end, list(e.params)] for e in errors]]
+
+
+def _decode(entry):
+    stmt, errors = entry
+    return stmt, [ErrorRecord(code, line, column, start, end, tuple(params))
+                  for code, line, column, start, end, params in errors]
+
+
+def validate_incremental(path, dialect_name, manifest_path, workers=1, rule_config=None,
+                         catalog=None):
+    """
+    Validate the files under path, reusing the results recorded in the
+    manifest at manifest_path, then rewrite the manifest for this run.
+
+    Returns (queries, results) like read_input() plus one
+    (statement_type, errors, seconds) result per query; seconds is None
+    for a result merged from the manifest.
+    """
+    run_fingerprint = fingerprint(dialect_name, rule_config, catalog)
+    previous = read_manifest(manifest_path) or {}
+    if (previous.get("version") != MANIFEST_VERSION
+            or previous.get("fingerprint") != run_fingerprint):
+        previous = {}
+    previous_files = previous.get("files", {})
+    known = previous.get("results", {})
+
+    queries = []
+    keys = []
+    files = {}
+    for file_path in input_files(path):
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        file_hash = _digest(data)
+        # Decoded like read_single_file's text-mode open (universal newlines)
+        text = io.TextIOWrapper(io.BytesIO(data)).read()
+        file_queries = split_queries(text, os.path.basename(file_path))
+
+        entry = previous_files.get(os.path.normpath(file_path))
+        if entry and entry["hash"] == file_hash and len(entry["statements"]) == len(file_queries):
+            # Unchanged file: its statement hashes are already known
+            file_keys = entry["statements"]
+        else:
+            file_keys = [_digest(q["sql"].encode("utf-8")) for q in file_queries]
+
+        files[os.path.normpath(file_path)] = {"hash": file_hash, "statements": file_keys}
+        queries.extend(file_queries)
+        keys.extend(file_keys)
+
+    # Each new statement text is validated once, however often it repeats
+    todo = {}
+    for q, key in zip(queries, keys):
+        if key not in known and key not in todo:
+            todo[key] = q
+    if workers > 1 and todo:
+        fresh = validate_batch(list(todo.values()), dialect_name, workers,
+                               rule_config=rule_config, catalog=catalog)
+    else:
+        dialect = get_dialect(dialect_name)
+        engine = build_engine(dialect_name, rule_config)
+        fresh = (run_query(q["sql"], dialect, engine, catalog) for q in todo.values())
+    fresh = dict(zip(todo, fresh))
+
+    results = []
+    recorded = {}
+    for key in keys:
+        if key in recorded:
+            results.append(_decode(recorded[key]) + (None,))
+        elif key in fresh:
+            stmt, errors, seconds = fresh[key]
+            recorded[key] = _encode(stmt, errors)
+            results.append((stmt, errors, seconds))
+        else:
+            recorded[key] = known[key]
+            results.append(_decode(known[key]) + (None,))
+
+    write_manifest(manifest_path, {"version": MANIFEST_VERSION, "fingerprint": run_fingerprint,
+                                   "files": files, "results": recorded})
+    return queries, results
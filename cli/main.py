@@ -1,81 +1,132 @@
-from io_layer.reader import read_input
-from io_layer.writer import write_json_report
-from parser.tokenizer import tokenize
-from parser.rules import apply_rules
-from parser.parser import parse
-from parser.statement import get_statement_type
-from dialect.ansi import AnsiDialect
-from dialect.mysql import MySQLDialect
+from io_layer.reader import read_input, read_stream
+from io_layer.writer import write_json_report, write_error_catalog, write_summary, write_jsonl_record
+from cli.pipeline import DIALECTS, build_engine, get_dialect, run_query
+from cli.batch import validate_batch
+from cli.stream import validate_stream
+from cli.incremental import validate_incremental
+from cli.summary import Summary
+from schema.catalog import load_schema, write_snapshot
 import argparse
+import json
+import stat
 import sys
 import os
+import time
 
-DIALECTS = {
-    "ansi": AnsiDialect(),
-    "mysql": MySQLDialect()
-}
-
-def process(path, dialect_name="ansi"):
+def process(path, dialect_name="ansi", workers=1, codes_only=False, summary_only=False,
+            rule_config=None, catalog=None, manifest=None):
     """
     Process SQL queries from input files and generate validation reports.
     
     Args:
         path: File or directory path containing SQL queries
         dialect_name: SQL dialect to validate against (ansi, mysql)
+        workers: Number of worker processes; above 1 the batch is shared
+            with the workers through shared memory
+        codes_only: Emit error codes instead of message text in reports;
+            the code catalog is written to outputs/error_catalog.json
+        summary_only: Skip the per-query reports and only write
+            outputs/summary.json
+        rule_config: Rule selection config (see cli.pipeline.build_engine)
+        catalog: Optional schema.SchemaCatalog; table and column names
+            are then checked against it
+        manifest: Optional manifest file path; only new or changed
+            statements are validated and the rest is reused from it
+            (see cli.incremental)
     """
-    dialect = DIALECTS.get(dialect_name)
-    if not dialect:
-        raise ValueError(f"Unknown dialect: {dialect_name}. Available: {list(DIALECTS.keys())}")
+    dialect = get_dialect(dialect_name)
+    engine = build_engine(dialect_name, rule_config)
+    started = time.perf_counter()
     
-    queries = read_input(path)
+    if manifest:
+        queries, results = validate_incremental(path, dialect_name, manifest, workers,
+                                                rule_config, catalog)
+    else:
+        queries = read_input(path)
+        # Both are lazy: nothing is validated until the reports are written
+        if workers > 1:
+            results = validate_batch(queries, dialect_name, workers, rule_config=rule_config,
+                                     catalog=catalog)
+        else:
+            results = (run_query(q["sql"], dialect, engine, catalog) for q in queries)
     
     if not queries:
         print(f"No queries found in {path}")
         return
     
-    stats = {"total": 0, "passed": 0, "failed": 0}
+    summary = Summary(dialect_name)
+
+    if codes_only:
+        write_error_catalog()
     
-    for i, q in enumerate(queries, start=1):
-        sql = q["sql"]
-        src = q["source"]
-        errors = []
-        stats["total"] += 1
+    for i, (q, (stmt, errors, seconds)) in enumerate(zip(queries, results), start=1):
+        summary.add(q["source"], stmt, errors, seconds)
 
-        try:
-            tokens = tokenize(sql)
-            stmt = get_statement_type(tokens)
-            
-            # Apply all validation layers
-            errors.extend(apply_rules(sql, dialect.max_subquery_depth()))
-            errors.extend(parse(sql, tokens))
-            
-            if stmt:
-                errors.extend(dialect.validate_statement(stmt, tokens))
-                errors.extend(dialect.validate_clauses(stmt, tokens))
-                errors.extend(dialect.validate_ddl(stmt, tokens))
-                
-        except SyntaxError as e:
-            errors.append({"line": 1, "issue": "Syntax Error", "explanation": str(e)})
-        except Exception as e:
-            errors.append({"line": 1, "issue": "Fatal error", "explanation": str(e)})
+        if not summary_only:
+            status = "FAILED" if errors else "SUCCESS"
+            write_json_report(i, q["source"], q["sql"], status, errors, codes_only)
 
-        status = "FAILED" if errors else "SUCCESS"
-        if status == "SUCCESS":
-            stats["passed"] += 1
-        else:
-            stats["failed"] += 1
-            
-        write_json_report(i, src, sql, status, errors)
+    write_summary(summary.to_dict(time.perf_counter() - started))
     
     # Print summary
     print(f"\n{'='*60}")
     print(f"Validation Summary")
     print(f"{'='*60}")
-    print(f"Total Queries: {stats['total']}")
-    print(f"Passed: {stats['passed']}")
-    print(f"Failed: {stats['failed']}")
+    print(f"Total Queries: {summary.total}")
+    print(f"Passed: {summary.passed}")
+    print(f"Failed: {summary.failed}")
+    if manifest:
+        print(f"Reused from manifest: {summary.reused}")
     print(f"{'='*60}\n")
 
+
+def process_stream(stream, source, dialect_name="ansi", workers=1, codes_only=False,
+                   max_in_flight=None, rule_config=None, catalog=None, summary_only=False):
+    """
+    Validate SQL statements from a stream (stdin or a FIFO) as they arrive.
+
+    Each result is written to stdout as one JSON line as soon as it is
+    ready; the run summary goes to outputs/summary.json and the sustained
+    throughput to stderr once the stream ends.
+
+    Args:
+        stream: Text stream to read statements from
+        source: Name recorded as the source of every statement
+        dialect_name: SQL dialect to validate against (ansi, mysql)
+        workers: Number of worker processes validating concurrently
+        codes_only: Emit error codes instead of message text
+        max_in_flight: Maximum number of queued statements before reading
+            pauses (default: 4 per worker)
+        rule_config: Rule selection config (see cli.pipeline.build_engine)
+        catalog: Optional schema.SchemaCatalog to check names against
+        summary_only: Print no per-statement lines; only the summary and
+            the throughput are written
+    """
+    summary = Summary(dialect_name)
+    started = time.perf_counter()
+
+    if codes_only:
+        write_error_catalog()
+
+    def on_result(q_id, q, result):
+        stmt, errors, seconds = result
+        summary.add(q["source"], stmt, errors, seconds)
+        if summary_only:
+            return
+        status = "FAILED" if errors else "SUCCESS"
+        write_jsonl_record(q_id, q["source"], q["sql"], status, errors, codes_only)
+
+    validate_stream(read_stream(stream, source), dialect_name, on_result,
+                    workers=workers, max_in_flight=max_in_flight, rule_config=rule_config,
+                    catalog=catalog)
+
+    wall_seconds = time.perf_counter() - started
+    write_summary(summary.to_dict(wall_seconds))
+    print(f"Validated {summary.total} statements ({summary.failed} failed) in "
+          f"{wall_seconds:.2f}s: {summary.throughput(wall_seconds)} statements/s",
+          file=sys.stderr)
+
+
 if __name__ == "__main__":
     # Create argument parser
     parser = argparse.ArgumentParser(
@@ -86,6 +137,10 @@ Examples:
   python -m cli.main inputs --dialect ansi
   python -m cli.main inputs/query.txt --dialect mysql
   python -m cli.main ~/sql_files --dialect ansi
+  python -m cli.main ~/sql_files --workers 4
+  tail -f query.log | python -m cli.main - --workers 4
+  python -m cli.main inputs --schema schema.sql --schema-snapshot schema.snap
+  python -m cli.main sql --manifest .sqlvalidator-manifest.json
         """
     )
     
@@ -93,7 +148,8 @@ Examples:
     parser.add_argument(
         "path",
         metavar="PATH",
-        help="Path to SQL file or directory containing SQL files (required)"
+        help="Path to SQL file or directory containing SQL files, a FIFO, "
+             "or - to stream from stdin (required)"
     )
     
     # Optional argument: dialect
@@ -105,8 +161,148 @@ Examples:
         help="SQL dialect to validate against (default: ansi)"
     )
     
+    # Optional argument: parallel workers
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes used to validate queries (default: 1)"
+    )
+    
+    # Optional argument: compact reports
+    parser.add_argument(
+        "--codes-only",
+        action="store_true",
+        help="Write error codes instead of messages (catalog in outputs/error_catalog.json)"
+    )
+    
+    # Optional argument: aggregate output only
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Only write the aggregated outputs/summary.json, not one report (or, when "
+             "streaming, one JSON line) per query"
+    )
+    
+    # Optional argument: streaming buffer bound
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Streaming mode: statements queued before reading pauses (default: 4 per worker)"
+    )
+    
+    # Optional arguments: rule selection
+    parser.add_argument(
+        "--rules-config",
+        metavar="FILE",
+        help="JSON file selecting rules: enable, disable, fail_fast and per-dialect overrides"
+    )
+    parser.add_argument(
+        "--disable-rule",
+        metavar="NAME",
+        action="append",
+        default=[],
+        help="Skip a rule entirely (repeatable), e.g. --disable-rule subquery_depth"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop validating a query at its first error (cheapest rules run first)"
+    )
+    
+    # Optional arguments: bounded mode for pathological statements
+    parser.add_argument(
+        "--max-statement-chars",
+        metavar="N",
+        type=int,
+        help="Bounded mode: statements longer than N characters get structural checks only"
+    )
+    parser.add_argument(
+        "--max-tokens",
+        metavar="N",
+        type=int,
+        help="Bounded mode: statements with more than N tokens get structural checks only"
+    )
+    
+    # Optional arguments: schema-aware validation
+    parser.add_argument(
+        "--schema",
+        metavar="FILE",
+        help="Check table and column names against a schema: CREATE TABLE script, "
+             "JSON {\"table\": [columns]} or a snapshot written by --schema-snapshot"
+    )
+    parser.add_argument(
+        "--schema-snapshot",
+        metavar="FILE",
+        help="Save the loaded schema as a binary snapshot for faster loading next run"
+    )
+    
+    # Optional argument: incremental runs
+    parser.add_argument(
+        "--manifest",
+        metavar="FILE",
+        help="Incremental mode: reuse the results recorded in FILE for unchanged files "
+             "and statements, validate the rest and update FILE"
+    )
+    
     # Parse command-line arguments
     args = parser.parse_args()
+
+    catalog = None
+    if args.schema:
+        try:
+            catalog = load_schema(args.schema)
+            if args.schema_snapshot:
+                write_snapshot(catalog, args.schema_snapshot)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load schema {args.schema}: {e}", file=sys.stderr)
+            sys.exit(1)
+    elif args.schema_snapshot:
+        print("Error: --schema-snapshot requires --schema", file=sys.stderr)
+        sys.exit(1)
+
+    rule_config = {}
+    if args.rules_config:
+        try:
+            with open(args.rules_config, 'r') as f:
+                rule_config = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read rules config {args.rules_config}: {e}", file=sys.stderr)
+            sys.exit(1)
+    rule_config["disable"] = rule_config.get("disable", []) + args.disable_rule
+    if args.fail_fast:
+        rule_config["fail_fast"] = True
+    if args.max_statement_chars is not None:
+        rule_config["max_statement_chars"] = args.max_statement_chars
+    if args.max_tokens is not None:
+        rule_config["max_tokens"] = args.max_tokens
+    
+    # Streaming mode: stdin or a named pipe
+    if args.path == "-" or (os.path.exists(args.path) and stat.S_ISFIFO(os.stat(args.path).st_mode)):
+        if args.manifest:
+            print("Error: --manifest cannot be used in streaming mode", file=sys.stderr)
+            sys.exit(1)
+        try:
+            if args.path == "-":
+                process_stream(sys.stdin, "<stdin>", dialect_name=args.dialect,
+                               workers=args.workers, codes_only=args.codes_only,
+                               max_in_flight=args.max_in_flight, rule_config=rule_config,
+                               catalog=catalog, summary_only=args.summary_only)
+            else:
+                with open(args.path, 'r') as f:
+                    process_stream(f, os.path.basename(args.path), dialect_name=args.dialect,
+                                   workers=args.workers, codes_only=args.codes_only,
+                                   max_in_flight=args.max_in_flight, rule_config=rule_config,
+                                   catalog=catalog, summary_only=args.summary_only)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        except Exception as e:
+            print(f"Fatal error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
     
     # Validate that the path exists
     if not os.path.exists(args.path):
@@ -115,7 +311,9 @@ Examples:
     
     # Process the SQL queries
     try:
-        process(args.path, dialect_name=args.dialect)
+        process(args.path, dialect_name=args.dialect, workers=args.workers,
+                codes_only=args.codes_only, summary_only=args.summary_only,
+                rule_config=rule_config, catalog=catalog, manifest=args.manifest)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
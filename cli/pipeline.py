@@ -0,0 +1,132 @@
+"""
+Validation pipeline shared by the serial and parallel paths.
+
+Runs every validation layer (rules, parser, dialect and, when a schema
+catalog is given, name resolution) over one SQL statement and returns
+the accumulated error list.
+"""
+
+import time
+
+from parser.rules import RuleEngine
+from parser.parser import parse
+from parser.statement import get_statement_type
+from parser.bounded import StructuralChecker, bounded_tokens
+from parser.errors import error, SYNTAX_ERROR, FATAL_ERROR
+from dialect.base import Dialect
+from dialect.ansi import AnsiDialect
+from dialect.mysql import MySQLDialect
+from schema.resolver import resolve
+
+DIALECTS = {
+    "ansi": AnsiDialect(),
+    "mysql": MySQLDialect()
+}
+
+
+def get_dialect(dialect_name):
+    dialect = DIALECTS.get(dialect_name)
+    if not dialect:
+        raise ValueError(f"Unknown dialect: {dialect_name}. Available: {list(DIALECTS.keys())}")
+    return dialect
+
+
+def build_engine(dialect_name, config=None):
+    """
+    Build the RuleEngine for a dialect from an optional run config:
+
+        {"enable": [...], "disable": [...], "fail_fast": false,
+         "max_statement_chars": null, "max_tokens": null,
+         "dialects": {"mysql": {"enable": [...], "disable": [...]}}}
+
+    A dialect section's "enable" replaces the top-level one; "disable"
+    lists are combined with each other and with the dialect's own
+    disabled_rules(). The max_* caps turn on bounded mode (see
+    parser.bounded).
+    """
+    config = config or {}
+    dialect = get_dialect(dialect_name)
+    overrides = config.get("dialects", {}).get(dialect_name, {})
+    enabled = overrides.get("enable", config.get("enable"))
+    disabled = (set(dialect.disabled_rules())
+                | set(config.get("disable", []))
+                | set(overrides.get("disable", [])))
+    return RuleEngine(enabled, disabled, config.get("fail_fast", False),
+                      config.get("max_statement_chars"), config.get("max_tokens"))
+
+
+def _generic_clauses(dialect):
+    """Whether the dialect's clause checks are the generic, keyword-driven ones."""
+    return type(dialect).validate_clauses is Dialect.validate_clauses
+
+
+def check_structure(tokens, dialect, engine):
+    """
+    Structural checks only, streamed over the tokens (any iterable) of a
+    statement that is over the engine's caps; returns (statement_type,
+    errors).
+    """
+    generic = _generic_clauses(dialect)
+    checker = StructuralChecker(dialect.max_subquery_depth(), {r.name for r in engine.rules},
+                                dialect.forbidden_keywords() if generic else (),
+                                generic and dialect.numeric_limit())
+    checker.consume(tokens)
+    stmt = checker.statement
+    # Statement-level dialect checks only look at the leading token
+    statement_errors = dialect.validate_statement(stmt, [checker.first]) if stmt else []
+    return stmt, checker.finish(engine.fail_fast, statement_errors)
+
+
+def validate_query(sql, dialect, engine=None, catalog=None):
+    """
+    Validate a single SQL statement; returns (statement_type, errors).
+
+    engine is the RuleEngine to apply (default: every rule the dialect
+    does not disable). catalog is an optional schema.SchemaCatalog to
+    resolve table and column names against.
+
+    A statement over the engine's size or token caps is not tokenized into
+    a list; it only gets the streamed structural checks of check_structure.
+    """
+    if engine is None:
+        engine = RuleEngine(disabled=dialect.disabled_rules())
+    errors = []
+    stmt = None
+
+    try:
+        tokens, stream = bounded_tokens(sql, engine.max_statement_chars, engine.max_tokens)
+        if tokens is None:
+            return check_structure(stream, dialect, engine)
+        stmt = get_statement_type(tokens)
+
+        # Apply all validation layers, stopping early in fail-fast mode
+        errors.extend(engine.apply(sql, dialect.max_subquery_depth()))
+        if engine.fail_fast and errors:
+            return stmt, errors
+
+        errors.extend(parse(sql, tokens))
+        if engine.fail_fast and errors:
+            return stmt, errors
+
+        if stmt:
+            errors.extend(dialect.validate_statement(stmt, tokens))
+            errors.extend(dialect.validate_clauses(stmt, tokens))
+            errors.extend(dialect.validate_ddl(stmt, tokens))
+
+        if catalog is not None and not (engine.fail_fast and errors):
+            errors.extend(resolve(tokens, catalog))
+
+    except SyntaxError as e:
+        errors.append(error(SYNTAX_ERROR, e.lineno or 1, e.msg, column=e.offset))
+    except Exception as e:
+        errors.append(error(FATAL_ERROR, 1, str(e)))
+
+    return stmt, errors
+
+
+def run_query(sql, dialect, engine=None, catalog=None):
+    """Validate and time one statement; returns (statement_type, errors, seconds)."""
+    start = time.perf_counter()
+    stmt, errors = validate_query(sql, dialect, engine, catalog=catalog)
+    return stmt, errors, time.perf_counter() - start
+
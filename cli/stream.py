@@ -0,0 +1,80 @@
+"""
+Streaming validation for unbounded inputs such as stdin or a FIFO.
+
+Queries are validated as they arrive and each result is handed to a
+callback as soon as it is ready. With several workers, at most
+max_in_flight queries are queued at once: once the limit is reached the
+reader blocks, which in turn stops consuming the input pipe
+(backpressure) instead of buffering an ever-growing backlog.
+"""
+
+import multiprocessing
+import threading
+
+from cli.pipeline import build_engine, get_dialect, run_query
+
+_dialect = None
+_engine = None
+_catalog = None
+
+
+def _init_worker(dialect_name, rule_config, catalog):
+    global _dialect, _engine, _catalog
+    _dialect = get_dialect(dialect_name)
+    _engine = build_engine(dialect_name, rule_config)
+    _catalog = catalog
+
+
+def _run(sql):
+    return run_query(sql, _dialect, _engine, _catalog)
+
+
+def validate_stream(queries, dialect_name, on_result, workers=1, max_in_flight=None,
+                    rule_config=None, catalog=None):
+    """
+    Validate an iterable of queries, calling on_result(q_id, query, result)
+    as each one finishes. result is (statement_type, errors, seconds).
+
+    With workers > 1 results are delivered in completion order (q_id keeps
+    the input position) from a single thread.
+    """
+    dialect = get_dialect(dialect_name)
+    engine = build_engine(dialect_name, rule_config)
+
+    if workers <= 1:
+        for q_id, query in enumerate(queries, start=1):
+            on_result(q_id, query, run_query(query["sql"], dialect, engine, catalog))
+        return
+
+    slots = threading.BoundedSemaphore(max_in_flight or workers * 4)
+    failures = []
+
+    def deliver(q_id, query):
+        # Runs on the pool's result-handler thread; an exception escaping
+        # a callback would kill that thread, so it is recorded instead.
+        def done(result):
+            try:
+                on_result(q_id, query, result)
+            except Exception as exc:
+                failures.append(exc)
+            finally:
+                slots.release()
+        return done
+
+    def failed(exc):
+        failures.append(exc)
+        slots.release()
+
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(dialect_name, rule_config, catalog)) as pool:
+        for q_id, query in enumerate(queries, start=1):
+            slots.acquire()
+            if failures:
+                break
+            pool.apply_async(_run, (query["sql"],),
+                             callback=deliver(q_id, query), error_callback=failed)
+        pool.close()
+        pool.join()
+
+    if failures:
+        raise failures[0]
@@ -0,0 +1,139 @@
+"""
+Streaming aggregates for a validation run.
+
+Statistics are updated as each query finishes, so the run summary can be
+written once at the end without reading back the per-query reports.
+"""
+
+from bisect import bisect_left
+
+from parser.errors import CATALOG
+
+# Latency histogram bucket upper bounds, in microseconds (powers of two).
+LATENCY_BUCKETS_US = [2 ** k for k in range(4, 24)]
+
+# Codes whose issue text is a template; counted per rendered text as well
+_TEMPLATED = {code for code, (issue, _) in CATALOG.items() if "{" in issue}
+
+
+class Summary:
+    def __init__(self, dialect_name):
+        self.dialect = dialect_name
+        self.total = 0
+        self.passed = 0
+        self.failed = 0
+        self.reused = 0
+        self.by_issue = {}
+        self.by_issue_text = {}
+        self.by_source = {}
+        self.by_statement = {}
+        self.latency_count = 0
+        self.latency_total_us = 0.0
+        self.latency_min_us = None
+        self.latency_max_us = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_US) + 1)
+
+    def add(self, source, stmt, errors, seconds):
+        """
+        Fold one validated query into the running aggregates; seconds is
+        None for a result reused from a previous run (no latency sample).
+        """
+        self.total += 1
+        if errors:
+            self.failed += 1
+        else:
+            self.passed += 1
+
+        src = self.by_source.setdefault(source, {"total": 0, "failed": 0, "issues": {}})
+        kind = self.by_statement.setdefault(stmt or "UNKNOWN", {"total": 0, "failed": 0})
+        src["total"] += 1
+        kind["total"] += 1
+        if errors:
+            src["failed"] += 1
+            kind["failed"] += 1
+        for e in errors:
+            self.by_issue[e.code] = self.by_issue.get(e.code, 0) + 1
+            if e.code in _TEMPLATED:
+                # The issue text depends on the params ("Unclosed {0}")
+                texts = self.by_issue_text.setdefault(e.code, {})
+                texts[e.issue] = texts.get(e.issue, 0) + 1
+            src["issues"][e.code] = src["issues"].get(e.code, 0) + 1
+
+        if seconds is None:
+            self.reused += 1
+        else:
+            self._add_latency(seconds * 1e6)
+
+    def _add_latency(self, us):
+        self.latency_count += 1
+        self.latency_total_us += us
+        if self.latency_min_us is None or us < self.latency_min_us:
+            self.latency_min_us = us
+        if us > self.latency_max_us:
+            self.latency_max_us = us
+
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS_US, us)] += 1
+
+    def _percentile_us(self, fraction):
+        """Upper bound of the histogram bucket holding the given fraction."""
+        target = fraction * self.latency_count
+        seen = 0
+        for bucket, count in enumerate(self.latency_buckets):
+            seen += count
+            if count and seen >= target:
+                if bucket < len(LATENCY_BUCKETS_US):
+                    return LATENCY_BUCKETS_US[bucket]
+                return round(self.latency_max_us, 1)
+        return 0
+
+    def to_dict(self, wall_seconds=None):
+        histogram = {}
+        for bucket, count in enumerate(self.latency_buckets):
+            if count:
+                label = (f"<={LATENCY_BUCKETS_US[bucket]}" if bucket < len(LATENCY_BUCKETS_US)
+                         else f">{LATENCY_BUCKETS_US[-1]}")
+                histogram[label] = count
+
+        by_issue = {}
+        for code, count in sorted(self.by_issue.items(), key=lambda item: -item[1]):
+            by_issue[str(code)] = {"issue": CATALOG[code][0], "count": count}
+            if code in self.by_issue_text:
+                by_issue[str(code)]["by_params"] = dict(
+                    sorted(self.by_issue_text[code].items(), key=lambda item: -item[1]))
+        by_source = {
+            source: {
+                "total": s["total"],
+                "failed": s["failed"],
+                "issues": {str(code): count for code, count in sorted(s["issues"].items())}
+            }
+            for source, s in sorted(self.by_source.items())
+        }
+
+        data = {
+            "dialect": self.dialect,
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            **({"reused": self.reused} if self.reused else {}),
+            "by_issue": by_issue,
+            "by_source": by_source,
+            "by_statement": dict(sorted(self.by_statement.items())),
+            "latency_us": {
+                "count": self.latency_count,
+                "mean": round(self.latency_total_us / self.latency_count, 1) if self.latency_count else 0,
+                "min": round(self.latency_min_us or 0, 1),
+                "max": round(self.latency_max_us, 1),
+                "p50": self._percentile_us(0.50),
+                "p95": self._percentile_us(0.95),
+                "p99": self._percentile_us(0.99),
+                "histogram": histogram
+            }
+        }
+        if wall_seconds is not None:
+            data["wall_seconds"] = round(wall_seconds, 3)
+            data["statements_per_second"] = self.throughput(wall_seconds)
+        return data
+
+    def throughput(self, wall_seconds):
+        """Sustained rate over the whole run, in statements per second."""
+        return round(self.total / wall_seconds, 1) if wall_seconds > 0 else 0.0
@@ -1,5 +1,5 @@
 from dialect.base import Dialect
-from parser.errors import error
+from parser.errors import error_at, INVALID_STATEMENT
 
 class AnsiDialect(Dialect):
     def allowed_statements(self):
@@ -13,17 +13,8 @@ class AnsiDialect(Dialect):
 
     def validate_statement(self, stmt, tokens):
         if stmt not in self.allowed_statements():
-            return [error(1, "Invalid statement", f"Not allowed in ANSI sql {stmt}")]
+            return [error_at(tokens[0], INVALID_STATEMENT, stmt)]
         return []
 
-    def validate_clauses(self, stmt, tokens):
-        errors = []
-        # Extract values from 3-tuples (type, value, line)
-        keywords = [v for _, v, _ in tokens]
-        for k in self.forbidden_keywords():
-            if k in keywords:
-                errors.append(error(1, "Non_ANSI feature", f"{k} is not supported in ANSI SQL"))
-        return errors
-
     def validate_ddl(self, stmt, tokens):
         return []
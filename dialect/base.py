@@ -1,3 +1,5 @@
+from parser.errors import error_at, NON_ANSI_FEATURE, LIMIT_MISSING_NUMBER, LIMIT_NOT_NUMERIC
+
 class Dialect:
     def allowed_statements(self):
         return []
@@ -8,11 +10,36 @@ class Dialect:
     def forbidden_keywords(self):
         return []
 
+    def disabled_rules(self):
+        """Names of parser.rules rules that do not apply to this dialect."""
+        return []
+
+    def numeric_limit(self):
+        """Whether LIMIT must be followed by an integer literal."""
+        return False
+
     def validate_statement(self, stmt, tokens):
         return []
 
     def validate_clauses(self, stmt, tokens):
-        return []
+        # Driven only by forbidden_keywords() and numeric_limit(), so that
+        # bounded mode can stream the same checks (parser.bounded)
+        errors = []
+        # Extract values from (type, value, line, column, start, end) tuples
+        keywords = [t[1] for t in tokens]
+        for k in self.forbidden_keywords():
+            if k in keywords:
+                tok = tokens[keywords.index(k)]
+                errors.append(error_at(tok, NON_ANSI_FEATURE, k))
+        if self.numeric_limit() and "LIMIT" in keywords:
+            idx = keywords.index("LIMIT")
+            if idx == len(keywords) - 1:
+                errors.append(error_at(tokens[idx], LIMIT_MISSING_NUMBER))
+            else:
+                next_value = keywords[idx + 1]
+                if not next_value.isdigit():
+                    errors.append(error_at(tokens[idx + 1], LIMIT_NOT_NUMERIC))
+        return errors
 
     def validate_ddl(self, stmt, tokens):
         return []
@@ -1,5 +1,4 @@
 from dialect.base import Dialect
-from parser.errors import error
 
 class MySQLDialect(Dialect):
     def allowed_statements(self):
@@ -11,22 +10,11 @@ class MySQLDialect(Dialect):
     def forbidden_keywords(self):
         return []
 
+    def numeric_limit(self):
+        return True
+
     def validate_statement(self, stmt, tokens):
         return []
 
-    def validate_clauses(self, stmt, tokens):
-        errors = []
-        # Extract values from 3-tuples (type, value, line)
-        keywords = [v for _, v, _ in tokens]
-        if "LIMIT" in keywords:
-            idx = keywords.index("LIMIT")
-            if idx == len(keywords) - 1:
-                errors.append(error(1, "Invalid LIMIT", "LIMIT must be followed by number"))
-            else:
-                next_value = keywords[idx + 1]
-                if not next_value.isdigit():
-                    errors.append(error(1, "Invalid LIMIT", "LIMIT must be followed by numeric value"))
-        return errors
-
     def validate_ddl(self, stmt, tokens):
         return []
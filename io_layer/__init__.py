@@ -2,9 +2,11 @@
 IO Layer package.
 
 Handles:
-- Reading SQL input from files or folders
+- Reading SQL input from files, folders or streams (stdin, FIFOs)
 - Writing validation results to output files
+- Persisting the incremental-run manifest
 """
 
-from .reader import read_input
-from .writer import write_json_report
+from .reader import read_input, read_stream, input_files, split_queries
+from .writer import write_json_report, write_error_catalog, write_summary, write_jsonl_record
+from .manifest import read_manifest, write_manifest
@@ -0,0 +1,18 @@
+import json
+import os
+
+def read_manifest(path):
+    """Load a manifest written by write_manifest; None if it is missing or unreadable."""
+    try:
+        with open(path,'r') as f:
+            return json.load(f)
+    except (OSError,ValueError):
+        return None
+
+
+def write_manifest(path,manifest):
+    """Replace the manifest atomically, so an interrupted run never leaves half a file."""
+    tmp=path+".tmp"
+    with open(tmp,'w') as f:
+        json.dump(manifest,f,separators=(",",":"))
+    os.replace(tmp,path)
@@ -1,28 +1,58 @@
 import os
-def read_single_file(file_path):
+def split_queries(content,source):
+    """Split the text of one SQL file into queries on ';'."""
     queries=[]
-    with open (file_path,'r') as f:
-        content=f.read().strip()
-        
-        raw_queries = [q.strip() for q in content.split(';') if q.strip()]
-        
-        if not raw_queries:
-            return queries
-            
-        for query in raw_queries:
-            queries.append({"source":os.path.basename(file_path),"sql": query})
+    raw_queries = [q.strip() for q in content.strip().split(';') if q.strip()]
+
+    for query in raw_queries:
+        queries.append({"source":source,"sql": query})
     return queries
 
 
-def read_input(path):
-    all_queries=[]
+def read_single_file(file_path):
+    with open (file_path,'r') as f:
+        content=f.read()
+    return split_queries(content,os.path.basename(file_path))
+
+
+def input_files(path):
+    """The files read_input reads for path, in the same order."""
     if os.path.isfile(path):
-        all_queries.extend(read_single_file(path))
+        return [path]
     elif os.path.isdir(path):
+        files=[]
         for file in os.listdir(path):
             file_path=os.path.join(path,file)
             if os.path.isfile(file_path):
-                all_queries.extend(read_single_file(file_path))
+                files.append(file_path)
+        return files
     else:
         raise ValueError(f"Invalid path: {path}")
+
+
+def read_input(path):
+    all_queries=[]
+    for file_path in input_files(path):
+        all_queries.extend(read_single_file(file_path))
     return all_queries
+
+
+def read_stream(stream,source):
+    """
+    Incrementally split a text stream (stdin, FIFO) into queries.
+    Yields each statement as soon as its terminating ';' has been read,
+    so an endless log tail never has to be buffered in full.
+    """
+    pending=""
+    for chunk in stream:
+        pending+=chunk
+        if ';' not in chunk:
+            continue
+        *complete,pending=pending.split(';')
+        for query in complete:
+            query=query.strip()
+            if query:
+                yield {"source":source,"sql":query}
+    query=pending.strip()
+    if query:
+        yield {"source":source,"sql":query}
@@ -1,10 +1,43 @@
 import json
 import os
+import sys
+from parser.errors import CATALOG
 
-def write_json_report(q_id,src,sql,status,errors):
+def write_json_report(q_id,src,sql,status,errors,codes_only=False):
     os.makedirs("outputs",exist_ok=True)
 
+    # Error text is rendered here, from the catalog, only for reports that want it
+    errors=[e.to_dict(codes_only) for e in errors]
     data={"q_id":q_id,"source":src,"sql":sql,"status":status,"errors":errors}
 
     with open(f"outputs/query_{q_id}.json",'w') as f:
         json.dump(data,f,indent=4)
+
+
+def write_error_catalog():
+    """Write the code -> (issue, explanation) catalog used by codes-only reports."""
+    os.makedirs("outputs",exist_ok=True)
+
+    data={str(code):{"issue":issue,"explanation":explanation} for code,(issue,explanation) in CATALOG.items()}
+
+    with open("outputs/error_catalog.json",'w') as f:
+        json.dump(data,f,indent=4)
+
+
+def write_summary(summary):
+    """Write the aggregated run summary to outputs/summary.json."""
+    os.makedirs("outputs",exist_ok=True)
+
+    with open("outputs/summary.json",'w') as f:
+        json.dump(summary,f,indent=4)
+
+
+def write_jsonl_record(q_id,src,sql,status,errors,codes_only=False,out=None):
+    """Write one result as a single JSON line and flush it immediately."""
+    out=out or sys.stdout
+
+    errors=[e.to_dict(codes_only) for e in errors]
+    data={"q_id":q_id,"source":src,"sql":sql,"status":status,"errors":errors}
+
+    out.write(json.dumps(data,separators=(",",":"))+"\n")
+    out.flush()
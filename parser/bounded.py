@@ -0,0 +1,179 @@
+"""
+Bounded-memory validation of oversized statements.
+
+A statement over the configured caps (characters or tokens) is never
+materialized as a token list: its tokens are streamed from
+tokenizer.iter_tokens through a StructuralChecker, which keeps only a few
+counters (plus the depths of the subqueries currently open) and covers
+the structural checks only:
+
+- empty and unsupported statements (parser)
+- unmatched parentheses and CASE without END (rules)
+- leading and trailing operators (rules)
+- subqueries nested deeper than the dialect allows (rules)
+- the dialect's forbidden keywords and numeric LIMIT (and, in
+  cli.pipeline, its statement-level checks)
+
+Clause-level parser checks, the remaining rules and schema resolution need
+the whole token list or statement text and are skipped for such statements.
+"""
+
+from itertools import chain, islice
+
+from parser.tokenizer import iter_tokens
+from parser.errors import (
+    error, error_at,
+    EMPTY_QUERY, UNSUPPORTED_SQL,
+    UNMATCHED_PARENTHESES, LEADING_OPERATOR, TRAILING_OPERATOR, UNMATCHED_CASE,
+    SUBQUERY_TOO_DEEP,
+    NON_ANSI_FEATURE, LIMIT_MISSING_NUMBER, LIMIT_NOT_NUMERIC,
+)
+
+# Statement types parser.parse validates
+_SUPPORTED = {"SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER"}
+
+# Token types the rules treat as operators
+_OPERATORS = {"OPERATOR", "STAR"}
+
+
+def bounded_tokens(sql, max_chars=None, max_tokens=None):
+    """
+    Returns (tokens, None) when sql is within both caps, otherwise
+    (None, stream): an iterator over all of its tokens.
+
+    At most max_tokens + 1 tokens are held while finding out that a
+    statement is too long; the stream hands those out first and then
+    continues the same scan, so nothing is tokenized twice and the held
+    tokens are released as soon as they have been consumed.
+    """
+    stream = iter_tokens(sql)
+    if max_chars is not None and len(sql) > max_chars:
+        return None, stream
+    if max_tokens is None:
+        return list(stream), None
+    tokens = list(islice(stream, max_tokens + 1))
+    if len(tokens) <= max_tokens:
+        return tokens, None
+    return None, chain(tokens, stream)
+
+
+class StructuralChecker:
+    """
+    Streaming structural checks: feed() every token in order, then
+    finish() for the errors.
+
+    Args:
+        max_depth: Deepest allowed subquery nesting
+        rules: Names of the enabled rules; a structural check standing in
+            for a disabled rule is skipped
+        forbidden_keywords: Keywords the dialect does not allow
+        numeric_limit: Whether LIMIT must be followed by an integer literal
+    """
+
+    def __init__(self, max_depth, rules, forbidden_keywords=(), numeric_limit=False):
+        self.max_depth = max_depth
+        self.rules = rules
+        self.forbidden = set(forbidden_keywords)
+        self.numeric_limit = numeric_limit
+
+        self.first = None
+        self.last = None
+        self.depth = 0
+        self.outer_open = None
+        self.stray_close = None
+        self.subqueries = []
+        self.too_deep = None
+        self.first_case = None
+        self.cases = 0
+        self.ends = 0
+        self.keyword_errors = []
+        self.flagged = set()
+        self.limit = None
+        self.limit_seen = False
+
+    @property
+    def statement(self):
+        return self.first[1] if self.first else None
+
+    def feed(self, tok):
+        value = tok[1]
+        if self.limit is not None:
+            if not value.isdigit():
+                self.keyword_errors.append(error_at(tok, LIMIT_NOT_NUMERIC))
+            self.limit = None
+
+        if value == "(":
+            if self.depth == 0:
+                # The opening parenthesis of the outermost group still open
+                self.outer_open = tok
+            self.depth += 1
+        elif value == ")":
+            if self.depth == 0:
+                if self.stray_close is None:
+                    self.stray_close = tok
+            else:
+                self.depth -= 1
+                if self.subqueries and self.subqueries[-1] > self.depth:
+                    self.subqueries.pop()
+        elif value == "SELECT" and self.last is not None and self.last[1] == "(":
+            # Depths of the open subqueries: only as many as are nested
+            self.subqueries.append(self.depth)
+            if len(self.subqueries) > self.max_depth and self.too_deep is None:
+                self.too_deep = self.last
+        elif value == "CASE":
+            self.cases += 1
+            if self.first_case is None:
+                self.first_case = tok
+        elif value == "END":
+            self.ends += 1
+
+        if value in self.forbidden and value not in self.flagged:
+            self.flagged.add(value)
+            self.keyword_errors.append(error_at(tok, NON_ANSI_FEATURE, value))
+        if value == "LIMIT" and self.numeric_limit and not self.limit_seen:
+            self.limit_seen = True
+            self.limit = tok
+
+        if self.first is None:
+            self.first = tok
+        self.last = tok
+
+    def consume(self, tokens):
+        for tok in tokens:
+            self.feed(tok)
+        return self
+
+    def finish(self, fail_fast=False, statement_errors=()):
+        """
+        Errors in the order the full pipeline reports them; statement_errors
+        are the dialect's statement-level errors, placed before its clause
+        checks.
+        """
+        if self.first is None:
+            return [error(EMPTY_QUERY, 1, column=1)]
+
+        errors = []
+        balanced = self.stray_close is None and self.depth == 0
+        if not balanced and "balanced_parentheses" in self.rules:
+            errors.append(error_at(self.stray_close or self.outer_open, UNMATCHED_PARENTHESES))
+        if self.first[0] in _OPERATORS and "leading_operator" in self.rules:
+            errors.append(error_at(self.first, LEADING_OPERATOR))
+        if self.last[0] in _OPERATORS and "trailing_operator" in self.rules:
+            errors.append(error_at(self.last, TRAILING_OPERATOR))
+        if self.cases != self.ends and self.cases and "case_end" in self.rules:
+            errors.append(error_at(self.first_case, UNMATCHED_CASE))
+        if self.too_deep is not None and "subquery_depth" in self.rules:
+            errors.append(error_at(self.too_deep, SUBQUERY_TOO_DEEP, self.max_depth))
+        if fail_fast and errors:
+            return errors[:1]
+
+        if self.statement not in _SUPPORTED:
+            errors.append(error_at(self.first, UNSUPPORTED_SQL, self.statement))
+            if fail_fast:
+                return errors
+
+        errors.extend(statement_errors)
+        errors.extend(self.keyword_errors)
+        if self.limit is not None:
+            errors.append(error_at(self.limit, LIMIT_MISSING_NUMBER))
+        return errors
@@ -1,6 +1,191 @@
-def error(line, issue, explanation):
-    return {
-        "line": line,
-        "issue": issue,
-        "explanation": explanation
-    }
+from bisect import bisect_right
+from collections import namedtuple
+
+# =========================
+# ERROR CATALOG
+# =========================
+# Codes are stable: never renumber or reuse one, only append.
+# Message templates take positional params ({0}, {1}, ...).
+
+# Lexical / internal
+SYNTAX_ERROR = 100
+FATAL_ERROR = 101
+
+# Global rules (parser/rules.py)
+UNMATCHED_PARENTHESES = 200
+UNCLOSED_STRING = 201
+UNCLOSED_IDENTIFIER = 202
+SUBQUERY_TOO_DEEP = 203
+LEADING_OPERATOR = 204
+TRAILING_OPERATOR = 205
+UNMATCHED_CASE = 206
+EMPTY_IN_LIST = 207
+INVALID_ALIAS = 208
+UNCLOSED_AGGREGATE = 209
+
+# Statement structure (parser/parser.py)
+EMPTY_QUERY = 300
+UNSUPPORTED_SQL = 301
+SELECT_MISSING_FROM = 302
+EMPTY_SELECT_LIST = 303
+SELECT_MISSING_TABLE = 304
+EMPTY_WHERE = 305
+INVALID_GROUP_BY = 306
+EMPTY_GROUP_BY = 307
+INVALID_HAVING = 308
+EMPTY_HAVING = 309
+INVALID_ORDER_BY = 310
+EMPTY_ORDER_BY = 311
+EMPTY_LIMIT = 312
+INVALID_INSERT = 313
+INVALID_INSERT_ORDER = 314
+INSERT_MISSING_TABLE = 315
+INVALID_VALUES = 316
+MISSING_SET = 317
+UPDATE_MISSING_TABLE = 318
+EMPTY_SET = 319
+DELETE_MISSING_FROM = 320
+DELETE_MISSING_TABLE = 321
+INVALID_DDL = 322
+MISSING_TABLE_NAME = 323
+
+# Dialects (dialect/*.py)
+INVALID_STATEMENT = 400
+NON_ANSI_FEATURE = 401
+LIMIT_MISSING_NUMBER = 402
+LIMIT_NOT_NUMERIC = 403
+
+# Schema resolution (schema/resolver.py)
+UNKNOWN_TABLE = 500
+UNKNOWN_COLUMN = 501
+
+CATALOG = {
+    SYNTAX_ERROR: ("Syntax Error", "{0}"),
+    FATAL_ERROR: ("Fatal error", "{0}"),
+
+    UNMATCHED_PARENTHESES: ("Unmatched parentheses", "Number of ( and ) must be equal"),
+    UNCLOSED_STRING: ("Unclosed string literal", "String must start and end with single quotes"),
+    UNCLOSED_IDENTIFIER: ("Unclosed identifier", "Identifier must start and end with double quotes"),
+    SUBQUERY_TOO_DEEP: ("Subquery nested too deep", "Maximum allowed nesting is {0}"),
+    LEADING_OPERATOR: ("Leading operator", "Query cannot start with an operator"),
+    TRAILING_OPERATOR: ("Trailing operator", "Query cannot end with an operator"),
+    UNMATCHED_CASE: ("Unmatched CASE/END", "Every CASE must have a matching END"),
+    EMPTY_IN_LIST: ("Empty IN list", "IN clause must contain at least one value"),
+    INVALID_ALIAS: ("Invalid alias", "AS must be followed by a valid identifier"),
+    UNCLOSED_AGGREGATE: ("Unclosed {0}", "{0}(...) must be properly closed"),
+
+    EMPTY_QUERY: ("Empty query", "No SQL statement found"),
+    UNSUPPORTED_SQL: ("Unsupported SQL", "Statement type '{0}' is not yet supported"),
+    SELECT_MISSING_FROM: ("Missing FROM clause", "SELECT must contain FROM"),
+    EMPTY_SELECT_LIST: ("Empty SELECT list", "SELECT must specify columns or * before FROM"),
+    SELECT_MISSING_TABLE: ("Missing table", "FROM must be followed by a table or subquery"),
+    EMPTY_WHERE: ("Empty WHERE clause", "WHERE must be followed by a condition"),
+    INVALID_GROUP_BY: ("Invalid GROUP BY", "GROUP must be followed by BY"),
+    EMPTY_GROUP_BY: ("Empty GROUP BY", "GROUP BY must specify columns"),
+    INVALID_HAVING: ("Invalid HAVING", "HAVING requires GROUP BY"),
+    EMPTY_HAVING: ("Empty HAVING clause", "HAVING must be followed by a condition"),
+    INVALID_ORDER_BY: ("Invalid ORDER BY", "ORDER must be followed by BY"),
+    EMPTY_ORDER_BY: ("Empty ORDER BY", "ORDER BY must specify columns"),
+    EMPTY_LIMIT: ("Empty LIMIT clause", "LIMIT must be followed by a number"),
+    INVALID_INSERT: ("Invalid INSERT", "INSERT must use INTO and VALUES"),
+    INVALID_INSERT_ORDER: ("Invalid INSERT order", "INTO must come before VALUES"),
+    INSERT_MISSING_TABLE: ("Missing table", "INTO must be followed by a table name"),
+    INVALID_VALUES: ("Invalid VALUES", "VALUES must be followed by (...)"),
+    MISSING_SET: ("Missing SET clause", "UPDATE must contain SET"),
+    UPDATE_MISSING_TABLE: ("Missing table", "UPDATE must specify a table before SET"),
+    EMPTY_SET: ("Empty SET clause", "SET must be followed by column assignments"),
+    DELETE_MISSING_FROM: ("Missing FROM clause", "DELETE must use FROM"),
+    DELETE_MISSING_TABLE: ("Missing table", "FROM must be followed by a table name"),
+    INVALID_DDL: ("Invalid DDL", "DDL must specify TABLE"),
+    MISSING_TABLE_NAME: ("Missing table name", "TABLE must be followed by an identifier"),
+
+    INVALID_STATEMENT: ("Invalid statement", "Not allowed in ANSI sql {0}"),
+    NON_ANSI_FEATURE: ("Non_ANSI feature", "{0} is not supported in ANSI SQL"),
+    LIMIT_MISSING_NUMBER: ("Invalid LIMIT", "LIMIT must be followed by number"),
+    LIMIT_NOT_NUMERIC: ("Invalid LIMIT", "LIMIT must be followed by numeric value"),
+
+    UNKNOWN_TABLE: ("Unknown table", "Table '{0}' is not defined in the schema{1}"),
+    UNKNOWN_COLUMN: ("Unknown column", "Column '{0}' is not defined in {1}"),
+}
+
+
+class ErrorRecord(namedtuple("ErrorRecord", "code line column start end params")):
+    """
+    Compact validation error: a catalog code, its position and the
+    template params. Human-readable text is only rendered on demand.
+    """
+
+    __slots__ = ()
+
+    @property
+    def issue(self):
+        return CATALOG[self.code][0].format(*self.params)
+
+    @property
+    def explanation(self):
+        return CATALOG[self.code][1].format(*self.params)
+
+    def to_dict(self, codes_only=False):
+        err = {"code": self.code, "line": self.line}
+        if codes_only:
+            if self.params:
+                err["params"] = list(self.params)
+        else:
+            err["issue"] = self.issue
+            err["explanation"] = self.explanation
+        if self.column is not None:
+            err["column"] = self.column
+        if self.start is not None:
+            err["span"] = [self.start, self.end]
+        return err
+
+
+def error(code, line, *params, column=None, span=None):
+    """
+    Build an error for a catalog code. Raises ValueError for a code that
+    is not in CATALOG (such as a line number passed the pre-catalog way,
+    error(line, issue, explanation)) instead of failing later on render.
+    """
+    if code not in CATALOG:
+        raise ValueError(f"Unknown error code: {code!r}; add it to parser.errors.CATALOG")
+    start, end = span if span is not None else (None, None)
+    return ErrorRecord(code, line, column, start, end, params)
+
+
+def error_at(token, code, *params):
+    """Build an error anchored on a token's exact position."""
+    _, _, line, column, start, end = token
+    return ErrorRecord(code, line, column, start, end, params)
+
+
+class LineIndex:
+    """
+    Maps character offsets of a SQL string to 1-based (line, column).
+
+    Line start offsets are collected once, on first lookup, so statements
+    that never fail pay nothing; each lookup is then a binary search.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self._starts = None
+
+    def _line_starts(self):
+        if self._starts is None:
+            starts = [0]
+            pos = self.text.find("\n")
+            while pos != -1:
+                starts.append(pos + 1)
+                pos = self.text.find("\n", pos + 1)
+            self._starts = starts
+        return self._starts
+
+    def position(self, offset):
+        starts = self._line_starts()
+        line = bisect_right(starts, offset)
+        return line, offset - starts[line - 1] + 1
+
+    def error(self, start, end, code, *params):
+        """Build an error for the span [start, end) of the indexed text."""
+        line, column = self.position(start)
+        return ErrorRecord(code, line, column, start, end, params)
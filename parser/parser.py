@@ -1,4 +1,14 @@
-from parser.errors import error
+from parser.errors import (
+    error, error_at,
+    EMPTY_QUERY, UNSUPPORTED_SQL,
+    SELECT_MISSING_FROM, EMPTY_SELECT_LIST, SELECT_MISSING_TABLE, EMPTY_WHERE,
+    INVALID_GROUP_BY, EMPTY_GROUP_BY, INVALID_HAVING, EMPTY_HAVING,
+    INVALID_ORDER_BY, EMPTY_ORDER_BY, EMPTY_LIMIT,
+    INVALID_INSERT, INVALID_INSERT_ORDER, INSERT_MISSING_TABLE, INVALID_VALUES,
+    MISSING_SET, UPDATE_MISSING_TABLE, EMPTY_SET,
+    DELETE_MISSING_FROM, DELETE_MISSING_TABLE,
+    INVALID_DDL, MISSING_TABLE_NAME,
+)
 from parser.statement import get_statement_type
 
 
@@ -20,95 +30,53 @@ def _find_all_indices(tokens, value):
 # =========================
 def _validate_select(tokens, sql=""):
     errors = []
-    line = 1
 
     from_idx = _find_value_idx(tokens, "FROM")
 
     if from_idx == -1:
-        errors.append(error(line, "Missing FROM clause",
-                            "SELECT must contain FROM"))
+        errors.append(error_at(tokens[0], SELECT_MISSING_FROM))
     else:
         # Ensure SELECT list is not empty
         if from_idx <= 1:
-            errors.append(error(
-                line,
-                "Empty SELECT list",
-                "SELECT must specify columns or * before FROM"
-            ))
+            errors.append(error_at(tokens[from_idx], EMPTY_SELECT_LIST))
 
         # Ensure table exists after FROM
         if from_idx + 1 >= len(tokens):
-            errors.append(error(
-                line,
-                "Missing table",
-                "FROM must be followed by a table or subquery"
-            ))
+            errors.append(error_at(tokens[from_idx], SELECT_MISSING_TABLE))
 
     # WHERE validation
     where_idx = _find_value_idx(tokens, "WHERE")
     if where_idx != -1 and where_idx + 1 >= len(tokens):
-        errors.append(error(
-            line,
-            "Empty WHERE clause",
-            "WHERE must be followed by a condition"
-        ))
+        errors.append(error_at(tokens[where_idx], EMPTY_WHERE))
 
     # GROUP BY validation
     group_idx = _find_value_idx(tokens, "GROUP")
     if group_idx != -1:
         if group_idx + 1 >= len(tokens) or tokens[group_idx + 1][1] != "BY":
-            errors.append(error(
-                line,
-                "Invalid GROUP BY",
-                "GROUP must be followed by BY"
-            ))
+            errors.append(error_at(tokens[group_idx], INVALID_GROUP_BY))
         elif group_idx + 2 >= len(tokens):
-            errors.append(error(
-                line,
-                "Empty GROUP BY",
-                "GROUP BY must specify columns"
-            ))
+            errors.append(error_at(tokens[group_idx + 1], EMPTY_GROUP_BY))
 
     # HAVING validation
     having_idx = _find_value_idx(tokens, "HAVING")
     if having_idx != -1:
         if group_idx == -1:
-            errors.append(error(
-                line,
-                "Invalid HAVING",
-                "HAVING requires GROUP BY"
-            ))
+            errors.append(error_at(tokens[having_idx], INVALID_HAVING))
         elif having_idx + 1 >= len(tokens):
-            errors.append(error(
-                line,
-                "Empty HAVING clause",
-                "HAVING must be followed by a condition"
-            ))
+            errors.append(error_at(tokens[having_idx], EMPTY_HAVING))
 
     # ORDER BY validation
     order_idx = _find_value_idx(tokens, "ORDER")
     if order_idx != -1:
         if order_idx + 1 >= len(tokens) or tokens[order_idx + 1][1] != "BY":
-            errors.append(error(
-                line,
-                "Invalid ORDER BY",
-                "ORDER must be followed by BY"
-            ))
+            errors.append(error_at(tokens[order_idx], INVALID_ORDER_BY))
         elif order_idx + 2 >= len(tokens):
-            errors.append(error(
-                line,
-                "Empty ORDER BY",
-                "ORDER BY must specify columns"
-            ))
+            errors.append(error_at(tokens[order_idx + 1], EMPTY_ORDER_BY))
 
     # LIMIT validation
     limit_idx = _find_value_idx(tokens, "LIMIT")
     if limit_idx != -1 and limit_idx + 1 >= len(tokens):
-        errors.append(error(
-            line,
-            "Empty LIMIT clause",
-            "LIMIT must be followed by a number"
-        ))
+        errors.append(error_at(tokens[limit_idx], EMPTY_LIMIT))
 
     return errors
 
@@ -118,38 +86,21 @@ def _validate_select(tokens, sql=""):
 # =========================
 def _validate_insert(tokens):
     errors = []
-    line = 1
 
     into_idx = _find_value_idx(tokens, "INTO")
     values_idx = _find_value_idx(tokens, "VALUES")
 
     if into_idx == -1 or values_idx == -1:
-        errors.append(error(
-            line,
-            "Invalid INSERT",
-            "INSERT must use INTO and VALUES"
-        ))
+        errors.append(error_at(tokens[0], INVALID_INSERT))
     else:
         if into_idx > values_idx:
-            errors.append(error(
-                line,
-                "Invalid INSERT order",
-                "INTO must come before VALUES"
-            ))
+            errors.append(error_at(tokens[into_idx], INVALID_INSERT_ORDER))
 
         if into_idx + 1 >= len(tokens):
-            errors.append(error(
-                line,
-                "Missing table",
-                "INTO must be followed by a table name"
-            ))
+            errors.append(error_at(tokens[into_idx], INSERT_MISSING_TABLE))
 
         if values_idx + 1 >= len(tokens) or tokens[values_idx + 1][1] != "(":
-            errors.append(error(
-                line,
-                "Invalid VALUES",
-                "VALUES must be followed by (...)"
-            ))
+            errors.append(error_at(tokens[values_idx], INVALID_VALUES))
 
     return errors
 
@@ -159,38 +110,21 @@ def _validate_insert(tokens):
 # =========================
 def _validate_update(tokens):
     errors = []
-    line = 1
 
     set_idx = _find_value_idx(tokens, "SET")
 
     if set_idx == -1:
-        errors.append(error(
-            line,
-            "Missing SET clause",
-            "UPDATE must contain SET"
-        ))
+        errors.append(error_at(tokens[0], MISSING_SET))
     else:
         if set_idx <= 1:
-            errors.append(error(
-                line,
-                "Missing table",
-                "UPDATE must specify a table before SET"
-            ))
+            errors.append(error_at(tokens[set_idx], UPDATE_MISSING_TABLE))
 
         if set_idx + 1 >= len(tokens):
-            errors.append(error(
-                line,
-                "Empty SET clause",
-                "SET must be followed by column assignments"
-            ))
+            errors.append(error_at(tokens[set_idx], EMPTY_SET))
 
         where_idx = _find_value_idx(tokens, "WHERE")
         if where_idx != -1 and where_idx + 1 >= len(tokens):
-            errors.append(error(
-                line,
-                "Empty WHERE clause",
-                "WHERE must be followed by a condition"
-            ))
+            errors.append(error_at(tokens[where_idx], EMPTY_WHERE))
 
     return errors
 
@@ -200,23 +134,14 @@ def _validate_update(tokens):
 # =========================
 def _validate_delete(tokens):
     errors = []
-    line = 1
 
     from_idx = _find_value_idx(tokens, "FROM")
 
     if from_idx == -1:
-        errors.append(error(
-            line,
-            "Missing FROM clause",
-            "DELETE must use FROM"
-        ))
+        errors.append(error_at(tokens[0], DELETE_MISSING_FROM))
     else:
         if from_idx + 1 >= len(tokens):
-            errors.append(error(
-                line,
-                "Missing table",
-                "FROM must be followed by a table name"
-            ))
+            errors.append(error_at(tokens[from_idx], DELETE_MISSING_TABLE))
 
     return errors
 
@@ -226,23 +151,14 @@ def _validate_delete(tokens):
 # =========================
 def _validate_ddl(tokens):
     errors = []
-    line = 1
 
     table_idx = _find_value_idx(tokens, "TABLE")
 
     if table_idx == -1:
-        errors.append(error(
-            line,
-            "Invalid DDL",
-            "DDL must specify TABLE"
-        ))
+        errors.append(error_at(tokens[0], INVALID_DDL))
     else:
         if table_idx + 1 >= len(tokens):
-            errors.append(error(
-                line,
-                "Missing table name",
-                "TABLE must be followed by an identifier"
-            ))
+            errors.append(error_at(tokens[table_idx], MISSING_TABLE_NAME))
 
     return errors
 
@@ -254,12 +170,12 @@ def parse(sql, tokens):
     errors = []
 
     if not tokens:
-        return [error(1, "Empty query", "No SQL statement found")]
+        return [error(EMPTY_QUERY, 1, column=1)]
 
     stmt = get_statement_type(tokens)
 
     if not stmt:
-        return [error(1, "Empty query", "No SQL statement found")]
+        return [error_at(tokens[0], EMPTY_QUERY)]
 
     if stmt == "SELECT":
         errors.extend(_validate_select(tokens, sql))
@@ -272,10 +188,6 @@ def parse(sql, tokens):
     elif stmt in ("CREATE", "DROP", "ALTER"):
         errors.extend(_validate_ddl(tokens))
     else:
-        errors.append(error(
-            1,
-            "Unsupported SQL",
-            f"Statement type '{stmt}' is not yet supported"
-        ))
+        errors.append(error_at(tokens[0], UNSUPPORTED_SQL, stmt))
 
     return errors
@@ -1,39 +1,189 @@
 import re
-from parser.errors import error
+from parser.errors import (
+    LineIndex,
+    UNMATCHED_PARENTHESES, UNCLOSED_STRING, UNCLOSED_IDENTIFIER,
+    SUBQUERY_TOO_DEEP, LEADING_OPERATOR, TRAILING_OPERATOR, UNMATCHED_CASE,
+    EMPTY_IN_LIST, INVALID_ALIAS, UNCLOSED_AGGREGATE,
+)
 
-def apply_rules(sql, max_depth):
-    """
-    Apply comprehensive validation rules to SQL queries.
-    Checks for:
-    - Balanced parentheses
-    - Closed string literals
-    - Subquery nesting depth (specifically for SELECT statements)
-    - Reserved word conflicts
-    - Expression syntax
-    """
-    errors = []
-    line = 1
-    
-    # Check balanced parentheses
+# =========================
+# RULE REGISTRY
+# =========================
+# Every global check is a Rule registered under a stable name. The
+# engine runs enabled rules cheapest first, dependencies before their
+# dependents, so that under fail_fast a dependent never runs once the
+# check it builds on has failed. Without fail_fast every rule runs.
+
+RULES = {}
+
+_OPERATOR = r'[\+\-\*/%=<>!&|\|]'
+_LEADING_OPERATOR = re.compile(r'^' + _OPERATOR)
+_TRAILING_OPERATOR = re.compile(_OPERATOR + r'$')
+_EMPTY_IN = re.compile(r'\bIN\s*\(\s*\)', re.IGNORECASE)
+_BAD_ALIAS = re.compile(r'\bAS\s+(?=[^a-zA-Z_])', re.IGNORECASE)
+_AGGREGATES = [
+    (func, re.compile(rf'\b{func}\s*\(', re.IGNORECASE))
+    for func in ['COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'GROUP_CONCAT', 'STRING_AGG']
+]
+
+
+class Rule:
+    __slots__ = ("name", "cost", "depends", "check")
+
+    def __init__(self, name, cost, depends, check):
+        self.name = name
+        self.cost = cost
+        self.depends = depends
+        self.check = check
+
+
+class RuleContext:
+    """Per-statement inputs shared by all rules, computed at most once."""
+
+    def __init__(self, sql, max_depth):
+        self.sql = sql
+        self.max_depth = max_depth
+        self.index = LineIndex(sql)
+        self._upper = None
+
+    @property
+    def upper(self):
+        if self._upper is None:
+            self._upper = self.sql.upper()
+        return self._upper
+
+
+def rule(name, cost, depends=()):
+    """Register a check(ctx) -> errors function as a rule."""
+    def register(check):
+        RULES[name] = Rule(name, cost, tuple(depends), check)
+        return check
+    return register
+
+
+def _unmatched_paren(sql):
+    """Return the offset of the first parenthesis that has no partner."""
+    stack = []
+    for i, ch in enumerate(sql):
+        if ch == "(":
+            stack.append(i)
+        elif ch == ")":
+            if not stack:
+                return i
+            stack.pop()
+    return stack[0] if stack else 0
+
+
+# =========================
+# RULES
+# =========================
+@rule("balanced_parentheses", cost=1)
+def _balanced_parentheses(ctx):
+    sql = ctx.sql
     if sql.count("(") != sql.count(")"):
-        errors.append(error(line, "Unmatched parentheses", "Number of ( and ) must be equal"))
-    
-    # Check unclosed string literals (single quotes)
-    if sql.count("'") % 2 != 0:
-        errors.append(error(line, "Unclosed string literal", "String must start and end with single quotes"))
-    
-    # Check unclosed identifier quotes (double quotes)
-    if sql.count('"') % 2 != 0:
-        errors.append(error(line, "Unclosed identifier", "Identifier must start and end with double quotes"))
-    
-    # Check subquery nesting depth (only for SELECT statements in subqueries)
-    
+        pos = _unmatched_paren(sql)
+        return [ctx.index.error(pos, pos + 1, UNMATCHED_PARENTHESES)]
+    return []
+
+
+@rule("string_literals", cost=1)
+def _string_literals(ctx):
+    # Unclosed string literals (single quotes)
+    if ctx.sql.count("'") % 2 != 0:
+        pos = ctx.sql.rfind("'")
+        return [ctx.index.error(pos, pos + 1, UNCLOSED_STRING)]
+    return []
+
+
+@rule("quoted_identifiers", cost=1)
+def _quoted_identifiers(ctx):
+    # Unclosed identifier quotes (double quotes)
+    if ctx.sql.count('"') % 2 != 0:
+        pos = ctx.sql.rfind('"')
+        return [ctx.index.error(pos, pos + 1, UNCLOSED_IDENTIFIER)]
+    return []
+
+
+@rule("leading_operator", cost=2)
+def _leading_operator(ctx):
+    stripped = ctx.sql.lstrip()
+    if stripped and _LEADING_OPERATOR.search(stripped):
+        pos = len(ctx.sql) - len(stripped)
+        return [ctx.index.error(pos, pos + 1, LEADING_OPERATOR)]
+    return []
+
+
+@rule("trailing_operator", cost=2)
+def _trailing_operator(ctx):
+    stripped = ctx.sql.rstrip()
+    if stripped and _TRAILING_OPERATOR.search(stripped):
+        pos = len(stripped) - 1
+        return [ctx.index.error(pos, pos + 1, TRAILING_OPERATOR)]
+    return []
+
+
+@rule("case_end", cost=2)
+def _case_end(ctx):
+    # Every CASE must be closed by an END
+    upper = ctx.upper
+    if 'CASE' in upper and upper.count('CASE') != upper.count('END'):
+        pos = upper.find('CASE')
+        return [ctx.index.error(pos, pos + 4, UNMATCHED_CASE)]
+    return []
+
+
+@rule("empty_in_list", cost=3)
+def _empty_in_list(ctx):
+    m = _EMPTY_IN.search(ctx.sql)
+    if m:
+        return [ctx.index.error(m.start(), m.end(), EMPTY_IN_LIST)]
+    return []
+
+
+@rule("alias", cost=3)
+def _alias(ctx):
+    # SELECT col AS should be followed by identifier
+    m = _BAD_ALIAS.search(ctx.sql)
+    if m:
+        return [ctx.index.error(m.start(), m.end(), INVALID_ALIAS)]
+    return []
+
+
+@rule("aggregate_closed", cost=5, depends=("balanced_parentheses",))
+def _aggregate_closed(ctx):
+    sql = ctx.sql
+    errors = []
+    for func, pattern in _AGGREGATES:
+        # Aggregate functions should have parentheses; find if it's closed properly
+        start_idx = pattern.search(sql)
+        if start_idx:
+            paren_count = 0
+            found_close = False
+            for i in range(start_idx.end() - 1, len(sql)):
+                if sql[i] == '(':
+                    paren_count += 1
+                elif sql[i] == ')':
+                    paren_count -= 1
+                    if paren_count == 0:
+                        found_close = True
+                        break
+
+            if not found_close:
+                errors.append(ctx.index.error(start_idx.start(), start_idx.end(), UNCLOSED_AGGREGATE, func))
+    return errors
+
+
+@rule("subquery_depth", cost=8, depends=("balanced_parentheses",))
+def _subquery_depth(ctx):
+    # Subquery nesting depth (only for SELECT statements in subqueries)
+    sql = ctx.sql
     depth = 0
     max_seen = 0
+    deepest_pos = 0
     in_string = False
     string_char = None
     paren_stack = []
-    
+
     for i, ch in enumerate(sql):
         # Track string literals to avoid counting parentheses inside strings
         if ch in ("'", '"') and (i == 0 or sql[i-1] != "\\"):
@@ -43,116 +193,99 @@ def apply_rules(sql, max_depth):
             elif ch == string_char:
                 in_string = False
                 string_char = None
-        
+
         if not in_string:
             if ch == "(":
-                # Check if this looks like a subquery (preceded by SELECT/WHERE/etc or no keyword)
-                # Simple heuristic: if it contains SELECT, it's likely a subquery
                 paren_stack.append(i)
                 depth += 1
-                max_seen = max(max_seen, depth)
+                if depth > max_seen:
+                    max_seen = depth
+                    deepest_pos = i
             elif ch == ")":
                 if paren_stack:
                     start_paren = paren_stack.pop()
-                    # Check if the content between parentheses contains SELECT
-                    inner_content = sql[start_paren+1:i].strip()
                     # Only count as subquery nesting if it contains SELECT
-                    if "SELECT" not in inner_content.upper():
-                        # Not a subquery, don't count in nesting depth
+                    if "SELECT" not in sql[start_paren+1:i].upper():
                         max_seen = max(0, max_seen - 1)
                 depth -= 1
-    
-    if max_seen > max_depth:
-        errors.append(error(line, "Subquery nested too deep", f"Maximum allowed nesting is {max_depth}"))
-    
-    # Check for common syntax issues
-    # Multiple spaces can sometimes indicate syntax errors
-    if "  " in sql:
-        # This is just informational, not necessarily an error
-        pass
-    
-    # Check for dangling operators (basic check)
-    # Look for operators at the end or beginning
-    stripped = sql.strip()
-    operator_pattern = r'[\+\-\*/%=<>!&|\|]'
-    
-    if stripped and re.search(r'^' + operator_pattern, stripped):
-        errors.append(error(line, "Leading operator", "Query cannot start with an operator"))
-    
-    if stripped and re.search(operator_pattern + r'$', stripped):
-        errors.append(error(line, "Trailing operator", "Query cannot end with an operator"))
-    
-    # Check for consecutive operators (except for known operators like !=, <=, >=, <>)
-    if re.search(r'[\+\-\*/%]\s*[\+\-\*/%]', sql):
-        # Allow for unary operators
-        if not re.search(r'[\(,]\s*[-+]\s*[\d(]', sql):
-            # Could be an error, but might be unary operator
-            pass
-    
-    # Check for valid CASE statement structure if present
-    if 'CASE' in sql.upper():
-        case_count = sql.upper().count('CASE')
-        end_count = sql.upper().count('END')
-        if case_count != end_count:
-            errors.append(error(line, "Unmatched CASE/END", "Every CASE must have a matching END"))
-    
-    # Check for BETWEEN syntax
-    between_pattern = r'\bBETWEEN\b.*?\bAND\b'
-    between_matches = re.findall(between_pattern, sql, re.IGNORECASE)
-    # Basic validation - just ensure BETWEEN has matching AND nearby
-    
-    # Check for IN clause with empty value list
-    in_pattern = r'\bIN\s*\(\s*\)'
-    if re.search(in_pattern, sql, re.IGNORECASE):
-        errors.append(error(line, "Empty IN list", "IN clause must contain at least one value"))
-    
-    # Check for JOIN without ON (basic check)
-    # This is more of a warning as CROSS JOIN doesn't need ON
-    join_pattern = r'\b(INNER|LEFT|RIGHT|FULL)\s+JOIN\b'
-    on_pattern = r'\bON\b'
-    if re.search(join_pattern, sql, re.IGNORECASE) and not re.search(on_pattern, sql, re.IGNORECASE):
-        # Could be error or implicit join syntax
-        pass
-    
-    # Check for malformed column aliases (AS keyword)
-    # SELECT col AS should be followed by identifier
-    as_pattern = r'\bAS\s+(?=[^a-zA-Z_])'
-    if re.search(as_pattern, sql, re.IGNORECASE):
-        errors.append(error(line, "Invalid alias", "AS must be followed by a valid identifier"))
-    
-    # Check for aggregate functions without proper context
-    aggregate_funcs = ['COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'GROUP_CONCAT', 'STRING_AGG']
-    for func in aggregate_funcs:
-        # Aggregate functions should have parentheses
-        pattern = rf'\b{func}\s*\('
-        if re.search(pattern, sql, re.IGNORECASE):
-            # Find if it's closed properly
-            start_idx = re.search(pattern, sql, re.IGNORECASE)
-            if start_idx:
-                paren_count = 0
-                found_close = False
-                for i in range(start_idx.end() - 1, len(sql)):
-                    if sql[i] == '(':
-                        paren_count += 1
-                    elif sql[i] == ')':
-                        paren_count -= 1
-                        if paren_count == 0:
-                            found_close = True
-                            break
-                
-                if not found_close:
-                    errors.append(error(line, f"Unclosed {func}", f"{func}(...) must be properly closed"))
-    
-    # Check for DISTINCT usage
-    if 'DISTINCT' in sql.upper():
-        # DISTINCT should appear right after SELECT
-        select_idx = sql.upper().find('SELECT')
-        distinct_idx = sql.upper().find('DISTINCT')
-        if select_idx != -1 and distinct_idx != -1:
-            between = sql[select_idx + 6:distinct_idx].strip()
-            if between and between != '*':
-                # DISTINCT might be in wrong position
-                pass
-    
-    return errors
-    
+
+    if max_seen > ctx.max_depth:
+        return [ctx.index.error(deepest_pos, deepest_pos + 1, SUBQUERY_TOO_DEEP, ctx.max_depth)]
+    return []
+
+
+# =========================
+# ENGINE
+# =========================
+def _ordered(rules):
+    """Cheapest first, but never before a rule's (enabled) dependencies."""
+    pending = sorted(rules, key=lambda r: r.cost)
+    names = {r.name for r in pending}
+    ordered = []
+    placed = set()
+    while pending:
+        for r in pending:
+            if all(d in placed or d not in names for d in r.depends):
+                break
+        else:
+            raise ValueError(f"Circular rule dependencies: {[r.name for r in pending]}")
+        pending.remove(r)
+        ordered.append(r)
+        placed.add(r.name)
+    return ordered
+
+
+class RuleEngine:
+    """
+    Runs the enabled rules in cost order.
+
+    Args:
+        enabled: Names of the only rules to run (default: all registered)
+        disabled: Names of rules to skip; they are never evaluated
+        fail_fast: Stop at the first rule that reports an error
+        max_statement_chars: Bounded mode: statements longer than this get
+            structural checks only (see parser.bounded)
+        max_tokens: Bounded mode: likewise for statements with more tokens
+    """
+
+    def __init__(self, enabled=None, disabled=(), fail_fast=False, max_statement_chars=None,
+                 max_tokens=None):
+        unknown = (set(enabled or ()) | set(disabled)) - set(RULES)
+        if unknown:
+            raise ValueError(f"Unknown rules: {sorted(unknown)}. Available: {list(RULES)}")
+
+        names = set(RULES if enabled is None else enabled) - set(disabled)
+        self.fail_fast = fail_fast
+        self.max_statement_chars = max_statement_chars
+        self.max_tokens = max_tokens
+        self.rules = _ordered([r for r in RULES.values() if r.name in names])
+
+    def apply(self, sql, max_depth):
+        """Run every enabled rule over one statement."""
+        ctx = RuleContext(sql, max_depth)
+        errors = []
+        for r in self.rules:
+            found = r.check(ctx)
+            if found:
+                errors.extend(found)
+                if self.fail_fast:
+                    break
+        return errors
+
+
+DEFAULT_ENGINE = RuleEngine()
+
+
+def apply_rules(sql, max_depth, engine=None):
+    """
+    Apply the registered rules (all of them, or engine's selection) to
+    one SQL statement. Checks for:
+    - Balanced parentheses
+    - Closed string literals and quoted identifiers
+    - Leading and trailing operators
+    - CASE without END
+    - Empty IN lists and AS without an alias
+    - Unclosed aggregate calls
+    - Subquery nesting depth (specifically for SELECT statements)
+    """
+    return (engine or DEFAULT_ENGINE).apply(sql, max_depth)
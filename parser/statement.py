@@ -2,6 +2,6 @@ def get_statement_type(tokens):
     """Extract the first keyword as the statement type."""
     if not tokens:
         return None
-    # tokens now have 3 elements: (type, value, line)
+    # tokens are (type, value, line, column, start, end) tuples
     # Extract just the value (index 1)
     return tokens[0][1]
@@ -13,32 +13,54 @@ TOKENS = [
     ("WHITESPACE", r"\s+"),
 ]
 
-def tokenize(query):
+# All alternatives in one pattern, in the same priority order as TOKENS.
+# The keyword alternations are only tried where a letter follows, so long
+# runs of numbers and symbols do not pay for ~150 failed alternatives each.
+_LETTER_FIRST = {"KEYWORD", "AGGREGATE"}
+SCANNER = re.compile("|".join(
+    f"(?P<{ttype}>{'(?=[A-Za-z])' + pattern if ttype in _LETTER_FIRST else pattern})"
+    for ttype, pattern in TOKENS), re.IGNORECASE)
+
+
+def iter_tokens(query):
     """
-    Tokenizes SQL query into (type, value, line) tuples.
-    Tracks line numbers for better error reporting.
+    Lazily yield the tokens of query, exactly as tokenize() returns them.
+
+    Matches in place (no copies of the remaining text), so a consumer that
+    does not keep the tokens runs in constant memory however long the
+    statement is. Raises SyntaxError on reaching an invalid character.
     """
-    tokens = []
-    i = 0
+    pos = 0
     line = 1
-    
-    while i < len(query):
-        matched = False
-
-        for ttype, pattern in TOKENS:
-            m = re.match(pattern, query[i:], re.IGNORECASE)
-            if m:
-                val = m.group(0)
-                if ttype != "WHITESPACE":
-                    tokens.append((ttype, val.upper(), line))
-                
-                # Track newlines for line counting
-                line += val.count('\n')
-                i += len(val)
-                matched = True
-                break
-
-        if not matched:
-            raise SyntaxError(f"Invalid character near '{query[i]}' at line {line}")
-
-    return tokens
\ No newline at end of file
+    line_start = 0
+
+    for m in SCANNER.finditer(query):
+        if m.start() != pos:
+            # finditer skipped text no token matches
+            break
+        end = m.end()
+        ttype = m.lastgroup
+        if ttype != "WHITESPACE":
+            yield (ttype, m.group().upper(), line, pos - line_start + 1, pos, end)
+
+        # Track newlines for line counting
+        newlines = query.count("\n", pos, end)
+        if newlines:
+            line += newlines
+            line_start = query.rindex("\n", pos, end) + 1
+        pos = end
+
+    if pos < len(query):
+        err = SyntaxError(f"Invalid character near '{query[pos]}' at line {line}")
+        err.lineno = line
+        err.offset = pos - line_start + 1
+        raise err
+
+
+def tokenize(query):
+    """
+    Tokenizes SQL query into (type, value, line, column, start, end) tuples.
+    Tracks line/column and character offsets for precise error reporting.
+    Lines and columns are 1-based; start/end are 0-based offsets into query.
+    """
+    return list(iter_tokens(query))
@@ -0,0 +1,11 @@
+"""
+Schema package.
+
+Handles:
+- Building a table/column catalog from CREATE TABLE statements or JSON
+- Compact binary snapshots of the catalog for fast reloads
+- Resolving table and column references of a statement against it
+"""
+
+from .catalog import SchemaCatalog, load_schema
+from .resolver import resolve
@@ -0,0 +1,207 @@
+import json
+
+from parser.tokenizer import tokenize
+from parser.parser import parse
+
+# Snapshot layout: magic header, then a compact UTF-8 JSON
+# [version, table names, column name lists] array. JSON rather than
+# marshal: snapshots outlive the run (CI caches) and marshal's format is
+# neither stable across Python versions nor safe on malformed input.
+SNAPSHOT_MAGIC = b"SQLVCAT\x00"
+SNAPSHOT_VERSION = 2
+
+# Elements of a CREATE TABLE body that are not column definitions
+_CONSTRAINT_WORDS = {"PRIMARY", "FOREIGN", "CONSTRAINT", "UNIQUE", "CHECK", "INDEX", "KEY"}
+
+
+def fold(name):
+    """Case-fold an identifier the way the tokenizer does (upper case)."""
+    return name.upper()
+
+
+class SchemaCatalog:
+    """
+    In-memory index of tables and their columns.
+
+    Lookups go through hash maps of case-folded names (table -> column
+    set). A trie of table names, built lazily on first use, serves
+    prefix-based "did you mean" suggestions for unknown tables.
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self._trie = None
+
+    def __len__(self):
+        return len(self.tables)
+
+    def add_table(self, name, columns):
+        self.tables[fold(name)] = frozenset(fold(c) for c in columns)
+        self._trie = None
+
+    def has_table(self, name):
+        return name in self.tables
+
+    def columns(self, name):
+        """Column set of a (folded) table name, or None if unknown."""
+        return self.tables.get(name)
+
+    # =========================
+    # DDL / JSON INGESTION
+    # =========================
+    def ingest(self, sql):
+        """
+        Add the table defined by a CREATE TABLE statement.
+
+        Only statements the parser's DDL validation accepts are ingested;
+        returns True when a table was added.
+        """
+        try:
+            tokens = tokenize(sql)
+        except SyntaxError:
+            return False
+        if (len(tokens) < 3 or tokens[0][1] != "CREATE" or tokens[1][1] != "TABLE"
+                or parse(sql, tokens)):
+            return False
+
+        k = 2
+        # CREATE TABLE IF NOT EXISTS name
+        if [t[1] for t in tokens[2:5]] == ["IF", "NOT", "EXISTS"]:
+            k = 5
+        if k >= len(tokens):
+            return False
+        name = tokens[k][1]
+        k += 1
+        while k + 1 < len(tokens) and tokens[k][1] == ".":
+            name = tokens[k + 1][1]
+            k += 2
+
+        columns = []
+        depth = 0
+        expect_column = False
+        for t in tokens[k:]:
+            value = t[1]
+            if value == "(":
+                depth += 1
+                if depth == 1:
+                    expect_column = True
+                    continue
+            elif value == ")":
+                depth -= 1
+            elif value == "," and depth == 1:
+                expect_column = True
+                continue
+            if expect_column and depth == 1:
+                if value not in _CONSTRAINT_WORDS:
+                    columns.append(value)
+                expect_column = False
+
+        self.add_table(name, columns)
+        return True
+
+    def load_ddl(self, text):
+        """Ingest every CREATE TABLE of a ';'-separated SQL script."""
+        return sum(self.ingest(q.strip()) for q in text.split(";") if q.strip())
+
+    def load_json(self, data):
+        """Ingest a {"table": ["column", ...]} mapping."""
+        if not isinstance(data, dict):
+            raise ValueError("Schema JSON must map table names to column lists")
+        for name, columns in data.items():
+            self.add_table(name, columns)
+        return len(data)
+
+    # =========================
+    # SNAPSHOTS
+    # =========================
+    def to_snapshot(self):
+        names = list(self.tables)
+        columns = [sorted(self.tables[n]) for n in names]
+        payload = json.dumps([SNAPSHOT_VERSION, names, columns], separators=(",", ":"))
+        return SNAPSHOT_MAGIC + payload.encode("utf-8")
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """
+        Rebuild a catalog from to_snapshot() output. Raises ValueError for
+        anything else, including truncated or corrupt snapshots.
+        """
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("Not a schema snapshot")
+        try:
+            version, names, columns = json.loads(data[len(SNAPSHOT_MAGIC):])
+        except (TypeError, ValueError):
+            raise ValueError("Corrupt or outdated schema snapshot; "
+                             "write it again with --schema-snapshot") from None
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported schema snapshot version: {version}")
+        if not (isinstance(names, list) and isinstance(columns, list)
+                and len(names) == len(columns)
+                and all(isinstance(c, list) for c in columns)):
+            raise ValueError("Corrupt schema snapshot")
+        catalog = cls()
+        # Names are stored folded already; rebuild the maps without re-folding
+        try:
+            catalog.tables = dict(zip(names, map(frozenset, columns)))
+        except TypeError:
+            raise ValueError("Corrupt schema snapshot") from None
+        return catalog
+
+    # =========================
+    # SUGGESTIONS
+    # =========================
+    def _build_trie(self):
+        trie = {}
+        for name in self.tables:
+            node = trie
+            for ch in name:
+                node = node.setdefault(ch, {})
+            node[""] = name
+        return trie
+
+    def suggest(self, name):
+        """
+        A known table sharing the longest prefix with name, provided at
+        least half of name matches; None otherwise.
+        """
+        if self._trie is None:
+            self._trie = self._build_trie()
+        node = self._trie
+        matched = 0
+        for ch in name:
+            if ch not in node:
+                break
+            node = node[ch]
+            matched += 1
+        if matched == 0 or matched * 2 < len(name):
+            return None
+        while "" not in node:
+            node = node[min(node)]
+        return node[""]
+
+
+def load_schema(path):
+    """
+    Load a catalog from a snapshot, a JSON {"table": [columns]} file or a
+    SQL script of CREATE TABLE statements.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data.startswith(SNAPSHOT_MAGIC):
+        return SchemaCatalog.from_snapshot(data)
+
+    catalog = SchemaCatalog()
+    text = data.decode("utf-8")
+    if path.endswith(".json"):
+        catalog.load_json(json.loads(text))
+    else:
+        catalog.load_ddl(text)
+    if not catalog:
+        # Every statement would then fail as "Unknown table"
+        raise ValueError("No tables found (expected CREATE TABLE statements or a JSON mapping)")
+    return catalog
+
+
+def write_snapshot(catalog, path):
+    with open(path, 'wb') as f:
+        f.write(catalog.to_snapshot())
@@ -0,0 +1,192 @@
+from parser.errors import error_at, UNKNOWN_TABLE, UNKNOWN_COLUMN
+
+# Keywords after which a table reference follows
+_TABLE_CONTEXT = {"FROM", "JOIN", "INTO", "UPDATE"}
+
+# Identifiers that are SQL words or literals rather than column names
+_NON_COLUMN_WORDS = {
+    "NULL", "TRUE", "FALSE", "UNKNOWN", "IS", "ILIKE", "REGEXP", "RLIKE", "SIMILAR",
+    "TO", "ESCAPE", "DIV", "MOD", "XOR", "TOP", "IF", "USING", "NATURAL", "LATERAL",
+    "FETCH", "NEXT", "ONLY", "CURRENT_DATE", "CURRENT_TIME", "CURRENT_TIMESTAMP",
+    "CURRENT_USER", "LOCALTIME", "LOCALTIMESTAMP",
+}
+
+# Functions whose arguments may use FROM ("EXTRACT(YEAR FROM d)")
+_FROM_FUNCTIONS = {"EXTRACT", "SUBSTRING", "TRIM", "POSITION", "OVERLAY"}
+
+# Tokens after which a bare identifier is an implicit alias ("SUM(x) total")
+_ALIAS_AFTER = {"IDENTIFIER", "NUMBER", "STRING"}
+
+
+def _value(tokens, k):
+    return tokens[k][1] if k < len(tokens) else None
+
+
+def _alias(tokens, k, name, relations, consumed):
+    """Record the optional [AS] alias at token k for name; returns the next index."""
+    if _value(tokens, k) == "AS":
+        k += 1
+    if k < len(tokens) and tokens[k][0] == "IDENTIFIER":
+        relations[tokens[k][1]] = name
+        consumed.add(k)
+        k += 1
+    return k
+
+
+def _table_ref(tokens, k, relations, consumed):
+    """
+    Parse one table reference starting at token k.
+
+    Records alias -> table name in relations, marks the tokens it used in
+    consumed and returns the next index to scan plus the index of the
+    table-name token. For a derived table both are returned at its "(":
+    the caller scans the subquery and records its alias on reaching the
+    closing parenthesis.
+    """
+    if k >= len(tokens) or tokens[k][0] != "IDENTIFIER":
+        return k, None
+    name_idx = k
+    consumed.add(k)
+    k += 1
+    # schema.table: the last part names the table
+    while _value(tokens, k) == "." and k + 1 < len(tokens):
+        consumed.update((k, k + 1))
+        name_idx = k + 1
+        k += 2
+    name = tokens[name_idx][1]
+    relations[name] = name
+    return _alias(tokens, k, name, relations, consumed), name_idx
+
+
+def _table_list(tokens, k, context, relations, consumed, table_tokens):
+    """
+    Parse the table references after a FROM/JOIN/INTO/UPDATE (FROM takes
+    a comma-separated list) starting at token k. Returns the next index
+    to scan and whether it is the "(" of a derived table.
+    """
+    while True:
+        start = k
+        k, name_idx = _table_ref(tokens, k, relations, consumed)
+        if name_idx is not None:
+            table_tokens.append(name_idx)
+        elif k == start and _value(tokens, k) == "(":
+            return k, True
+        if context != "FROM" or _value(tokens, k) != ",":
+            return k, False
+        k += 1
+
+
+def resolve(tokens, catalog):
+    """
+    Resolve the table and column references of one statement against a
+    SchemaCatalog, in two linear passes over its tokens.
+
+    Names are resolved statement-wide: an unqualified column must exist in
+    one of the statement's tables (subqueries included). Column checks are
+    skipped when a relation is a derived table, a CTE or itself unknown.
+    """
+    if not tokens:
+        return []
+    errors = []
+    stmt = tokens[0][1]
+
+    if stmt == "CREATE":
+        return errors
+    if stmt in ("DROP", "ALTER"):
+        # IF EXISTS makes a missing table legal
+        if (_value(tokens, 1) == "TABLE" and len(tokens) > 2
+                and [t[1] for t in tokens[2:4]] != ["IF", "EXISTS"]
+                and not catalog.has_table(tokens[2][1])):
+            errors.append(_unknown_table(tokens[2], catalog))
+        return errors
+
+    # Pass 1: relations, aliases and CTE names
+    relations = {}
+    consumed = set()
+    ctes = set()
+    select_aliases = set()
+    table_tokens = []
+    calls = []
+    # Parenthesis depth of each open derived table -> its FROM/JOIN context
+    derived = {}
+    k = 0
+    while k < len(tokens):
+        ttype, value = tokens[k][0], tokens[k][1]
+        if value == "(":
+            calls.append(tokens[k - 1][1] if k else None)
+        elif value == ")" and calls:
+            calls.pop()
+            context = derived.pop(len(calls), None)
+            if context is not None:
+                # End of a derived table: its alias follows, then possibly
+                # more of a FROM list
+                k = _alias(tokens, k + 1, None, relations, consumed)
+                if context == "FROM" and _value(tokens, k) == ",":
+                    k, opens = _table_list(tokens, k + 1, context, relations, consumed,
+                                           table_tokens)
+                    if opens:
+                        derived[len(calls)] = context
+                continue
+        elif value in _TABLE_CONTEXT and not (calls and calls[-1] in _FROM_FUNCTIONS):
+            k, opens = _table_list(tokens, k + 1, value, relations, consumed, table_tokens)
+            if opens:
+                derived[len(calls)] = value
+            continue
+        elif ttype == "IDENTIFIER":
+            prev = tokens[k - 1] if k else None
+            if _value(tokens, k + 1) == "AS" and _value(tokens, k + 2) == "(":
+                ctes.add(value)
+                consumed.add(k)
+            elif prev is not None and (prev[1] == "AS" or prev[1] == ")" or prev[0] in _ALIAS_AFTER):
+                select_aliases.add(value)
+                consumed.add(k)
+        k += 1
+
+    unresolved = False
+    for k in table_tokens:
+        name = tokens[k][1]
+        if name in ctes:
+            relations[name] = None
+        elif not catalog.has_table(name):
+            errors.append(_unknown_table(tokens[k], catalog))
+            unresolved = True
+    for alias, name in list(relations.items()):
+        if name in ctes:
+            relations[alias] = None
+    unresolved = unresolved or None in relations.values()
+
+    known = {name for name in relations.values() if name is not None and catalog.has_table(name)}
+    all_columns = set()
+    for name in known:
+        all_columns |= catalog.columns(name)
+
+    # Pass 2: column references
+    for k, tok in enumerate(tokens):
+        if tok[0] != "IDENTIFIER" or k in consumed:
+            continue
+        value = tok[1]
+        if _value(tokens, k + 1) == "(" or value in _NON_COLUMN_WORDS:
+            continue
+        if _value(tokens, k + 1) == ".":
+            # qualifier.column
+            name = relations.get(value)
+            col = tokens[k + 2] if k + 2 < len(tokens) else None
+            if name in known and col is not None and col[0] == "IDENTIFIER":
+                if col[1] not in catalog.columns(name):
+                    errors.append(error_at(col, UNKNOWN_COLUMN, col[1], f"table '{name}'"))
+            continue
+        if k and tokens[k - 1][1] == ".":
+            continue
+        if unresolved or not known or value in select_aliases or value in relations:
+            continue
+        if value not in all_columns:
+            where = ", ".join(f"'{n}'" for n in sorted(known))
+            errors.append(error_at(tok, UNKNOWN_COLUMN, value, f"table {where}" if len(known) == 1
+                                   else f"any of tables {where}"))
+
+    return errors
+
+
+def _unknown_table(token, catalog):
+    hint = catalog.suggest(token[1])
+    return error_at(token, UNKNOWN_TABLE, token[1], f"; did you mean '{hint}'?" if hint else "")
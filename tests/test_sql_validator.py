@@ -115,3 +115,249 @@ def test_mysql_limit_allowed():
     errors += parse(sql, tokenize(sql))
     errors += d.validate_clauses("SELECT", tokenize(sql))
     assert errors == []
+
+
+def test_tokenizer_positions():
+    tokens = tokenize("SELECT a\n  FROM t")
+    assert tokens[2] == ("KEYWORD", "FROM", 2, 3, 11, 15)
+
+
+def test_parse_error_position():
+    sql = "SELECT *\nFROM users\nWHERE"
+    errors = parse(sql, tokenize(sql))
+    assert errors[0].line == 3
+    assert errors[0].column == 1
+    assert (errors[0].start, errors[0].end) == (20, 25)
+
+
+def test_rule_error_position():
+    sql = "SELECT *\nFROM users\nWHERE id IN ( )"
+    errors = apply_rules(sql, 2)
+    assert errors[0].issue == "Empty IN list"
+    assert (errors[0].line, errors[0].column) == (3, 10)
+
+
+def test_batch_matches_serial():
+    from cli.batch import validate_batch
+    from cli.pipeline import get_dialect, validate_query
+    queries = [{"source": "t", "sql": s} for s in (
+        "SELECT name FROM users",
+        "SELECT *\nFROM users\nWHERE",
+        "SELECT * FROM users LIMIT 5",
+        "SELECT # FROM users",
+    )]
+    serial = [validate_query(q["sql"], get_dialect("ansi")) for q in queries]
+    batch = validate_batch(queries, "ansi", workers=2, chunksize=3)
+    assert [(stmt, errors) for stmt, errors, _ in batch] == serial
+
+
+def test_error_record_renders_from_catalog():
+    from parser.errors import NON_ANSI_FEATURE
+    errors = AnsiDialect().validate_clauses("SELECT", tokenize("SELECT * FROM t LIMIT 5"))
+    assert errors[0].code == NON_ANSI_FEATURE
+    assert errors[0].to_dict() == {
+        "code": NON_ANSI_FEATURE,
+        "line": 1,
+        "issue": "Non_ANSI feature",
+        "explanation": "LIMIT is not supported in ANSI SQL",
+        "column": 17,
+        "span": [16, 21],
+    }
+    assert errors[0].to_dict(codes_only=True)["params"] == ["LIMIT"]
+
+    # The pre-catalog call shape error(line, issue, explanation) is rejected
+    from parser.errors import error
+    with pytest.raises(ValueError):
+        error(1, "Invalid statement", "not allowed")
+
+
+def test_summary_aggregates():
+    from cli.summary import Summary
+    from parser.errors import NON_ANSI_FEATURE
+    d = AnsiDialect()
+    summary = Summary("ansi")
+    for src, sql in (("a.sql", "SELECT * FROM t LIMIT 5"), ("a.sql", "SELECT * FROM t"),
+                     ("b.sql", "DELETE FROM t")):
+        tokens = tokenize(sql)
+        summary.add(src, tokens[0][1], d.validate_clauses(tokens[0][1], tokens), 0.00005)
+    data = summary.to_dict()
+    assert (data["total"], data["passed"], data["failed"]) == (3, 2, 1)
+    assert data["by_issue"][str(NON_ANSI_FEATURE)]["count"] == 1
+    assert data["by_source"]["a.sql"] == {"total": 2, "failed": 1, "issues": {str(NON_ANSI_FEATURE): 1}}
+    assert data["by_statement"]["DELETE"] == {"total": 1, "failed": 0}
+    assert data["latency_us"]["histogram"] == {"<=64": 3}
+
+
+def test_read_stream_splits_incrementally():
+    from io_layer.reader import read_stream
+    lines = iter(["SELECT a\n", "FROM t; SELECT b", " FROM u;\n", "SELECT c FROM v"])
+    queries = read_stream(lines, "<stdin>")
+    assert next(queries) == {"source": "<stdin>", "sql": "SELECT a\nFROM t"}
+    assert [q["sql"] for q in queries] == ["SELECT b FROM u", "SELECT c FROM v"]
+
+
+def test_validate_stream_bounded_workers():
+    from cli.stream import validate_stream
+    queries = [{"source": "s", "sql": f"SELECT * FROM t LIMIT {n}"} for n in range(10)]
+    seen = {}
+    validate_stream(queries, "mysql", lambda q_id, q, result: seen.setdefault(q_id, result),
+                    workers=2, max_in_flight=3)
+    assert sorted(seen) == list(range(1, 11))
+    assert all(stmt == "SELECT" and errors == [] for stmt, errors, _ in seen.values())
+
+
+def test_rule_engine_orders_by_cost_and_dependencies():
+    from parser.rules import RuleEngine
+    names = [r.name for r in RuleEngine().rules]
+    assert names[:3] == ["balanced_parentheses", "string_literals", "quoted_identifiers"]
+    assert names[-1] == "subquery_depth"
+    assert names.index("aggregate_closed") > names.index("balanced_parentheses")
+
+
+def test_rule_engine_disable_and_fail_fast():
+    from parser.rules import RuleEngine
+    sql = "SELECT COUNT(id FROM t WHERE name='x"
+    assert [e.issue for e in apply_rules(sql, 2)] == [
+        "Unmatched parentheses", "Unclosed string literal", "Unclosed COUNT"]
+    assert [e.issue for e in RuleEngine(disabled=["balanced_parentheses"]).apply(sql, 2)] == [
+        "Unclosed string literal", "Unclosed COUNT"]
+    assert len(RuleEngine(fail_fast=True).apply(sql, 2)) == 1
+    with pytest.raises(ValueError):
+        RuleEngine(disabled=["no_such_rule"])
+
+
+def test_build_engine_dialect_overrides():
+    from cli.pipeline import build_engine
+    config = {"disable": ["alias"], "dialects": {"mysql": {"enable": ["case_end", "alias"]}}}
+    assert [r.name for r in build_engine("mysql", config).rules] == ["case_end"]
+    assert "alias" not in [r.name for r in build_engine("ansi", config).rules]
+
+
+def test_schema_catalog_resolves_names():
+    from schema import SchemaCatalog, resolve
+    catalog = SchemaCatalog()
+    assert catalog.load_ddl("CREATE TABLE employees (id INT, name TEXT, PRIMARY KEY (id));"
+                            "CREATE TABLE orders (id INT, emp_id INT)") == 2
+    assert catalog.columns("EMPLOYEES") == {"ID", "NAME"}
+
+    errors = resolve(tokenize("SELECT id FROM employes"), catalog)
+    assert [(e.issue, e.explanation) for e in errors] == [
+        ("Unknown table", "Table 'EMPLOYES' is not defined in the schema; did you mean 'EMPLOYEES'?")]
+    errors = resolve(tokenize("SELECT e.salary FROM employees e JOIN orders o ON o.emp_id = e.id"),
+                     catalog)
+    assert [(e.code, e.column) for e in errors] == [(501, 10)]
+    assert resolve(tokenize("SELECT name AS n, COUNT(*) total FROM employees GROUP BY name"),
+                   catalog) == []
+    # Derived-table aliases are recorded at the closing parenthesis, and a
+    # FROM list continues after them
+    errors = resolve(tokenize("SELECT x.id FROM (SELECT id FROM (SELECT id FROM employees) y) AS x, "
+                              "ordrs o"), catalog)
+    assert [(e.code, e.params[0]) for e in errors] == [(500, "ORDRS")]
+    assert [e.code for e in resolve(tokenize("DROP TABLE nosuch"), catalog)] == [500]
+    assert resolve(tokenize("DROP TABLE IF EXISTS nosuch"), catalog) == []
+
+
+def test_schema_snapshot_round_trip(tmp_path):
+    from schema import SchemaCatalog, load_schema
+    from schema.catalog import write_snapshot
+    catalog = SchemaCatalog()
+    catalog.load_json({"users": ["id", "name"]})
+    path = tmp_path / "schema.snap"
+    write_snapshot(catalog, str(path))
+    assert load_schema(str(path)).tables == catalog.tables
+
+    # A truncated snapshot, or a file with no tables, is a ValueError
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+    with pytest.raises(ValueError):
+        load_schema(str(path))
+    path.write_text("# Just some notes\n")
+    with pytest.raises(ValueError):
+        load_schema(str(path))
+
+
+def test_pipeline_with_schema():
+    from cli.pipeline import get_dialect, validate_query
+    from schema import SchemaCatalog
+    catalog = SchemaCatalog()
+    catalog.load_json({"users": ["id", "name"]})
+    dialect = get_dialect("ansi")
+    sqls = ["SELECT name FROM users", "SELECT email FROM users", "SELECT * FROM accounts"]
+    results = [validate_query(sql, dialect, catalog=catalog) for sql in sqls]
+    assert [[e.code for e in errors] for _, errors in results] == [[], [501], [500]]
+
+
+def test_incremental_reuses_unchanged_statements(tmp_path):
+    from cli.incremental import validate_incremental
+    sql_dir = tmp_path / "sql"
+    sql_dir.mkdir()
+    (sql_dir / "a.sql").write_text("SELECT * FROM users;\nSELECT * FROM t LIMIT 5;")
+    (sql_dir / "b.sql").write_text("DELETE FROM t;")
+    manifest = str(tmp_path / "manifest.json")
+
+    queries, first = validate_incremental(str(sql_dir), "ansi", manifest)
+    assert len(queries) == 3 and all(seconds is not None for _, _, seconds in first)
+
+    _, second = validate_incremental(str(sql_dir), "ansi", manifest)
+    assert [(stmt, errors) for stmt, errors, _ in second] == [
+        (stmt, errors) for stmt, errors, _ in first]
+    assert all(seconds is None for _, _, seconds in second)
+
+    (sql_dir / "a.sql").write_text("SELECT * FROM users;\nSELECT * FROM t WHERE id = (1;")
+    queries, third = validate_incremental(str(sql_dir), "ansi", manifest)
+    by_sql = {q["sql"]: seconds for q, (_, _, seconds) in zip(queries, third)}
+    assert by_sql["SELECT * FROM users"] is None
+    assert by_sql["SELECT * FROM t WHERE id = (1"] is not None
+
+    # CRLF files are read with universal newlines, as read_input does
+    from io_layer.reader import read_input
+    (sql_dir / "b.sql").write_bytes(b"SELECT *\r\nFROM users\r\nWHERE;")
+    queries, crlf = validate_incremental(str(sql_dir / "b.sql"), "ansi", manifest)
+    assert queries == read_input(str(sql_dir / "b.sql"))
+    assert crlf[0][1][0].start == 20
+
+    # A different dialect invalidates every recorded result
+    _, mysql = validate_incremental(str(sql_dir), "mysql", manifest)
+    assert all(seconds is not None for _, _, seconds in mysql)
+
+
+def test_iter_tokens_matches_tokenize():
+    from parser.tokenizer import iter_tokens
+    sql = "SELECT name,\n  COUNT(*) FROM users WHERE note = 'a\nb' AND id IN (1, 2.5)"
+    assert list(iter_tokens(sql)) == tokenize(sql)
+    tokens = iter_tokens("SELECT 1 # x")
+    assert next(tokens)[1] == "SELECT"
+    with pytest.raises(SyntaxError):
+        list(tokens)
+
+
+def test_bounded_mode_structural_checks():
+    from parser.bounded import bounded_tokens
+    from cli.pipeline import build_engine, get_dialect, validate_query
+    sql = "SELECT * FROM t WHERE id IN (" + ", ".join(map(str, range(1000)))
+    tokens, stream = bounded_tokens(sql, max_tokens=100)
+    assert tokens is None and list(stream) == tokenize(sql)
+    tokens, stream = bounded_tokens(sql, max_chars=100)
+    assert tokens is None and list(stream) == tokenize(sql)
+    assert bounded_tokens("SELECT 1", 100, 100) == (tokenize("SELECT 1"), None)
+
+    dialect = get_dialect("mysql")
+    engine = build_engine("mysql", {"max_tokens": 100})
+    sqls = [sql, sql + ") LIMIT x", "FOO " + sql + ")", sql + ")", "SELECT * FROM t LIMIT x"]
+    results = [validate_query(s, dialect, engine) for s in sqls]
+    assert [[e.code for e in errors] for _, errors in results] == [
+        [200], [403], [301], [], [403]]
+    assert results[0][1][0].column == 29
+
+
+def test_summary_counts_templated_issues_per_params():
+    from cli.summary import Summary
+    from parser.errors import UNCLOSED_AGGREGATE
+    from parser.rules import RuleEngine
+    engine = RuleEngine(enabled=["aggregate_closed"])
+    summary = Summary("ansi")
+    for sql in ("SELECT COUNT(id FROM t", "SELECT SUM(x FROM t", "SELECT COUNT(y FROM t"):
+        summary.add("a.sql", "SELECT", engine.apply(sql, 2), 0.00005)
+    issue = summary.to_dict()["by_issue"][str(UNCLOSED_AGGREGATE)]
+    assert issue["count"] == 3
+    assert issue["by_params"] == {"Unclosed COUNT": 2, "Unclosed SUM": 1}